@@ -6,12 +6,114 @@ AI Test Runner - Compiles, executes, and provides coverage for AI-generated C an
 import os
 import sys
 import argparse
+import functools
+import io
+import itertools
 import shutil
+import stat
 import subprocess
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
 import glob
 import re
 
+# Source extensions by language, as tuples so str.endswith can test them in one call
+_C_EXTENSIONS = ('.c',)
+_CPP_EXTENSIONS = ('.cpp', '.cc', '.cxx', '.c++')
+# Test source extensions, in lookup priority order
+_TEST_EXTENSIONS = _C_EXTENSIONS + _CPP_EXTENSIONS
+
+# Match patterns like: return_type function_name(parameters) {
+_FUNC_DEF_RE = re.compile(r'(\w+\s+(\w+)\s*\([^)]*\))\s*\{')
+# A main() definition in source under test
+_MAIN_RE = re.compile(r'\bint\s+main\s*\(')
+# A call to main(), i.e. 'main(' not preceded by 'int ' or 'void '
+_MAIN_CALL_RE = re.compile(r'(?<!\bint\s)(?<!\bvoid\s)\bmain\s*\(')
+# One test result line: Unity's "file:line:test:PASS" / ":FAIL: msg", or the
+# bundled gtest's "[ PASS ] name" / "[ FAIL ] name: msg"
+_RESULT_RE = re.compile(rb'^(?:[^\n]*?:|\[ )(PASS|FAIL)', re.MULTILINE)
+# A C test #including a source file itself (not just a header), in any include form;
+# group 1 is the file's basename
+_C_SOURCE_INCLUDE_RE = re.compile(
+    r'^[^\S\n]*#[^\S\n]*include\s*[<"](?:[^>"\n]*[/\\])?([^/\\>"\n]+\.c)[>"]', re.MULTILINE
+)
+# The line including unity.h in a C test
+_UNITY_INC_RE = re.compile(r'^[^\S\n]*#include\s*"unity\.h".*$', re.MULTILINE)
+# Unity's run summary line, e.g. "5 Tests 1 Failures 0 Ignored"
+_SUMMARY_RE = re.compile(rb'^\s*(\d+)\s+Tests\s+(\d+)\s+Failures', re.MULTILINE)
+
+# Sections of tests/review/review_required.md; [^\S\n] is whitespace other than newline
+_GENERATED_SECTION_RE = re.compile(r'^[^\S\n]*## Generated test files[^\S\n]*$', re.MULTILINE)
+_LIST_ITEM_RE = re.compile(r'^[^\S\n]*-+[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+
+# Source directory recorded in a CMakeCache.txt
+_CMAKE_HOME_RE = re.compile(rb'^CMAKE_HOME_DIRECTORY:INTERNAL=(.*?)\r?$', re.MULTILINE)
+
+# Build files a CMake generator leaves behind only after a successful configure
+_CMAKE_BUILD_FILES = ("build.ninja", "Makefile")
+
+# -D options run() configures the repo with
+_RUN_CMAKE_OPTIONS = {"RAILWAY_FETCH_GTEST": "ON"}
+
+# Exact content an APPROVED.<test>.flag file must have (after CRLF normalization)
+_REQUIRED_APPROVAL = b"approved = true\nreviewed_by = <human_name>\ndate = <ISO date>\n"
+
+# Unity release downloaded when no reference copy is available
+_UNITY_VERSION = "2.5.2"
+_UNITY_URL = f"https://github.com/ThrowTheSwitch/Unity/archive/refs/tags/v{_UNITY_VERSION}.zip"
+
+# Seconds a single test executable may run
+_TEST_TIMEOUT = 30
+
+
+# One C++ test target in the generated CMakeLists.txt; {objects} is the
+# (possibly empty) line linking the shared source objects
+_CPP_TEST_TARGET_TEMPLATE = """\
+# Test executable for {name}
+add_executable({name}
+  tests/{fname}
+  arduino_stubs/Arduino_stubs.cpp
+{objects})
+target_include_directories({name} PRIVATE ${{CMAKE_CURRENT_SOURCE_DIR}})
+target_include_directories({name} PRIVATE ${{CMAKE_CURRENT_SOURCE_DIR}}/src)
+target_include_directories({name} PRIVATE arduino_stubs)
+target_include_directories({name} PRIVATE gtest)
+
+add_test(
+  NAME {name}
+  COMMAND {name}
+)
+"""
+
+
+# Separators and layout of a per-executable test report
+_REPORT_RULE = "=" * 60
+_REPORT_SUBRULE = "-" * 20
+_REPORT_ERRORS_RULE = "-" * 10
+_TEST_REPORT_TEMPLATE = """\
+{rule}
+TEST REPORT: {name}
+{rule}
+
+EXECUTION SUMMARY
+{subrule}
+Test Executable: {name}
+Exit Code: {returncode}
+Overall Status: {status}
+Individual Tests Run: {tests}
+Individual Tests Passed: {passed}
+Individual Tests Failed: {failed}
+
+{errors}DETAILED OUTPUT
+{subrule}
+{output}
+{rule}
+"""
+
 
 def _enforce_manual_review_gate(repo_root: Path) -> None:
     """MANDATORY HUMAN REVIEW GATE — DO NOT BYPASS.
@@ -22,7 +124,6 @@ def _enforce_manual_review_gate(repo_root: Path) -> None:
 
     review_dir = repo_root / "tests" / "review"
     review_required_path = review_dir / "review_required.md"
-    required = "approved = true\nreviewed_by = <human_name>\ndate = <ISO date>\n"
 
     def _parse_generated_test_files(path: Path) -> list[Path]:
         try:
@@ -30,29 +131,19 @@ def _enforce_manual_review_gate(repo_root: Path) -> None:
         except Exception:
             return []
 
-        lines = text.split("\n")
-        in_section = False
-        generated: list[Path] = []
-
-        for line in lines:
-            if line.strip() == "## Generated test files":
-                in_section = True
-                continue
-            if in_section and line.startswith("## "):
-                break
-            if not in_section:
-                continue
+        heading = _GENERATED_SECTION_RE.search(text)
+        if heading is None:
+            return []
+        end = text.find("\n## ", heading.end())
+        section = text[heading.end():end if end != -1 else None]
 
-            stripped = line.strip()
-            if not stripped.startswith("-"):
-                continue
-            item = stripped.lstrip("-").strip()
+        generated: list[Path] = []
+        for match in _LIST_ITEM_RE.finditer(section):
+            item = match.group(1)
             if not item or item == "(none)":
                 continue
-
             # Normalize separators and interpret as repo-relative.
-            item = item.replace("\\", "/")
-            generated.append(repo_root / Path(item))
+            generated.append(repo_root / Path(item.replace("\\", "/")))
 
         return generated
 
@@ -65,22 +156,246 @@ def _enforce_manual_review_gate(repo_root: Path) -> None:
         approval_name = f"APPROVED.{test_path.name}.flag"
         approved_path = review_dir / approval_name
         try:
-            content = approved_path.read_text(encoding="utf-8").replace("\r\n", "\n")
-        except Exception:
+            content = approved_path.read_bytes()
+        except OSError:
             print("❌ Manual review not approved. Build and execution halted.")
             raise SystemExit(3)
 
-        if content != required:
+        if content.replace(b"\r\n", b"\n") != _REQUIRED_APPROVAL:
             print("❌ Manual review not approved. Build and execution halted.")
             raise SystemExit(3)
 
 
+def _parse_ctest_junit(junit_path: Path) -> List[Dict[str, Any]]:
+    """Per-test results from a `ctest --output-junit` report (CTest 3.21+).
+
+    Tests CTest could not run (status "notrun"/"disabled") count as not passed,
+    matching CTest's own exit status. A missing or unreadable report yields [].
+    """
+    try:
+        root = ET.parse(junit_path).getroot()
+    except (OSError, ET.ParseError):
+        return []
+    return [{
+        "name": case.get("name", ""),
+        "passed": case.get("status") == "run" and case.find("failure") is None,
+        "output": case.findtext("system-out") or "",
+    } for case in root.iter("testcase")]
+
+
+def _ctest_supports_junit() -> bool:
+    """Check whether the ctest on PATH accepts --output-junit (added in CTest 3.21)."""
+    try:
+        version = subprocess.run(["ctest", "--version"], capture_output=True, text=True).stdout
+    except OSError:
+        return False
+    match = re.search(r'(\d+)\.(\d+)', version or "")
+    return match is not None and (int(match.group(1)), int(match.group(2))) >= (3, 21)
+
+
+def positive_int(value: str) -> int:
+    """argparse type for job counts: an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def cmake_generator_args(build_dir: Path) -> List[str]:
+    """Select Ninja when available for a fresh build tree.
+
+    CMake pins the generator on first configure, so an existing CMakeCache.txt
+    keeps whatever generator it was created with.
+    """
+    if shutil.which("ninja") and not (Path(build_dir) / "CMakeCache.txt").exists():
+        return ["-G", "Ninja"]
+    return []
+
+
+def needs_configure(
+    build_dir: Union[str, os.PathLike],
+    src_dir: Union[str, os.PathLike],
+    cache_options: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Check whether build_dir lacks a completed configure of src_dir.
+
+    A matching cache lets the configure step be skipped; `cmake --build`
+    re-runs CMake by itself if any CMakeLists.txt changed since. CMake writes
+    CMakeCache.txt even when configure fails, so the generator's build file must
+    exist too, and every -D option in cache_options must be cached with that value.
+    """
+    build_dir = Path(build_dir)
+    try:
+        cache = (build_dir / "CMakeCache.txt").read_bytes()
+    except OSError:
+        return True
+    match = _CMAKE_HOME_RE.search(cache)
+    if match is None:
+        return True
+    cached_src = os.fsdecode(match.group(1))
+    if os.path.normcase(os.path.realpath(cached_src)) != os.path.normcase(os.path.realpath(src_dir)):
+        return True
+
+    # Only written once generation succeeds (Ninja, Makefiles, Visual Studio, Xcode)
+    generated = any((build_dir / name).is_file() for name in _CMAKE_BUILD_FILES) or any(
+        entry.name.endswith((".sln", ".xcodeproj")) for entry in os.scandir(build_dir)
+    )
+    if not generated:
+        return True
+
+    for name, value in (cache_options or {}).items():
+        option_re = rb'^' + re.escape(name.encode()) + rb':[^=\n]*=' + re.escape(value.encode()) + rb'\r?$'
+        if re.search(option_re, cache, re.MULTILINE) is None:
+            return True
+    return False
+
+
+def _link_or_copy(
+    src: Union[str, os.PathLike], dst: Union[str, os.PathLike]
+) -> Union[str, os.PathLike]:
+    """copytree copy_function that hardlinks files, copying when linking is not possible."""
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device or unsupported filesystem
+        shutil.copy2(src, dst)
+    return dst
+
+
+def parallel_copytree(
+    src: Union[str, os.PathLike],
+    dst: Union[str, os.PathLike],
+    workers: int = 8,
+    copy_function: Callable[[str, str], object] = shutil.copy2,
+) -> Union[str, os.PathLike]:
+    """Copy a directory tree, creating all directories first and then copying files concurrently."""
+    src_files = []
+    dst_files = []
+    for dirpath, _dirnames, filenames in os.walk(src, followlinks=True):
+        target = os.path.join(dst, os.path.relpath(dirpath, src))
+        os.makedirs(target, exist_ok=True)
+        for name in filenames:
+            src_files.append(os.path.join(dirpath, name))
+            dst_files.append(os.path.join(target, name))
+
+    # Per-file copies are syscall-bound, so overlap them
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(copy_function, src_files, dst_files))
+    return dst
+
+
+def _unity_cache_dir() -> Path:
+    """User-wide directory holding the pinned Unity release's src/ files."""
+    # The XDG spec says relative values are invalid; they would also break the symlink
+    cache_home = os.environ.get("XDG_CACHE_HOME", "")
+    if not os.path.isabs(cache_home):
+        cache_home = str(Path.home() / ".cache")
+    return Path(cache_home) / "ai_test_runner" / f"unity-v{_UNITY_VERSION}"
+
+
+def _download_unity(cache_dir: Path) -> None:
+    """Download the pinned Unity release and atomically install its src/ as cache_dir."""
+    # urllib.request pulls in http.client, email and ssl, a large share of this
+    # module's import time; it is only needed on a cache miss, so import it here
+    import urllib.request
+
+    print("📥 Downloading Unity framework...")
+    # The archive is small, so read it straight into memory
+    with urllib.request.urlopen(_UNITY_URL) as response:
+        archive = io.BytesIO(response.read())
+
+    # Extract only the src directory in one pass, next to the cache entry
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    temp_dir = cache_dir.parent / f".{cache_dir.name}.{os.getpid()}.tmp"
+    prefix = f"Unity-{_UNITY_VERSION}/src/"
+    try:
+        with zipfile.ZipFile(archive) as zip_ref:
+            members = [m for m in zip_ref.namelist() if m.startswith(prefix)]
+            zip_ref.extractall(temp_dir, members=members)
+        try:
+            os.rename(temp_dir / prefix, cache_dir)
+        except OSError:
+            # Another run installed it first
+            if not cache_dir.is_dir():
+                raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Downloaded Unity framework")
+
+
+def _discard_tree(path: Path) -> None:
+    """Move a directory tree out of the way at once and delete it in the background.
+
+    The rename frees the path for a fresh copy immediately. The deleting thread is
+    not a daemon, so an exiting interpreter waits for it instead of leaving the tree
+    behind. Falls back to deleting in place when the tree cannot be renamed.
+    """
+    victim = path.with_name(f"{path.name}.old.{os.getpid()}.{threading.get_ident()}")
+    try:
+        os.replace(path, victim)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    threading.Thread(target=shutil.rmtree, args=(victim,), kwargs={"ignore_errors": True}).start()
+
+
+@functools.lru_cache(maxsize=None)
+def _strip_test_prefix(stem: str) -> str:
+    """Name of the source under test for a test file stem (test_X -> X)."""
+    return stem[5:] if stem.startswith("test_") else stem
+
+
+def _include_source_under_test(content: str, source_name: str) -> str:
+    """Add '#include "../src/<source_name>.c"' after a C test's unity.h include.
+
+    Tests that already include something from ../src/, or the source in any other
+    form, are returned unchanged.
+    """
+    if '#include "../src/' in content or f"{source_name}.c" in _C_SOURCE_INCLUDE_RE.findall(content):
+        return content
+    return _UNITY_INC_RE.sub(f'\\g<0>\n#include "../src/{source_name}.c"', content, count=1)
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that content.
+
+    Leaving identical files untouched keeps their mtime, so CMake does not
+    rebuild everything that depends on them. Returns True if the file was written.
+    """
+    new = content.encode("utf-8")
+    try:
+        if path.read_bytes() == new:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(new)
+    return True
+
+
+def _is_executable_file(path) -> bool:
+    """Check for a regular, owner-executable file with a single stat() call."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & stat.S_IXUSR)
 
 
 class AITestRunner:
     """AI Test Runner - Builds, executes, and covers AI-generated C and C++ tests"""
 
-    def __init__(self, repo_path: str, output_dir: str = "build", language: str = "auto"):
+    def __init__(
+        self,
+        repo_path: str,
+        output_dir: str = "build",
+        language: str = "auto",
+        jobs: Optional[int] = None,
+        build_jobs: Optional[int] = None,
+    ):
         self.repo_path = Path(repo_path).resolve()
         out = Path(output_dir)
         if out.is_absolute():
@@ -100,7 +415,10 @@ class AITestRunner:
         self.test_reports_dir = self.tests_dir / "test_reports"
         self.source_dir = self.repo_path / "src"
         self.language = language  # "c", "cpp", or "auto"
-        import xml.etree.ElementTree as ET
+        self.jobs = jobs or os.cpu_count() or 1  # concurrent test executables
+        self.build_jobs = build_jobs or os.cpu_count() or 1  # parallel compile jobs
+        # Executable names declared by the CMakeLists.txt generated in this run
+        self._expected_executables = []
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -113,11 +431,9 @@ class AITestRunner:
             return self.language
 
         # Check file extensions
-        cpp_extensions = ['.cpp', '.cc', '.cxx', '.c++']
-        c_extensions = ['.c']
-
-        has_cpp = any(any(test_file.name.endswith(ext) for ext in cpp_extensions) for test_file in test_files)
-        has_c = any(any(test_file.name.endswith(ext) for ext in c_extensions) for test_file in test_files)
+        names = [test_file.name for test_file in test_files]
+        has_cpp = any(name.endswith(_CPP_EXTENSIONS) for name in names)
+        has_c = any(name.endswith(_C_EXTENSIONS) for name in names)
 
         if has_cpp:
             return "cpp"
@@ -126,6 +442,24 @@ class AITestRunner:
         else:
             return "cpp"  # Default to C++
 
+    @functools.cached_property
+    def _test_file_index(self):
+        """Map test stem -> test source path, built from one scan of the tests directory.
+
+        The tests directory does not change during a run, so the scan is done once.
+        When several files share a stem, the earlier extension in _TEST_EXTENSIONS wins.
+        """
+        test_index = {}
+        with os.scandir(self.tests_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext not in _TEST_EXTENSIONS or not entry.is_file():
+                    continue
+                current = test_index.get(stem)
+                if current is None or _TEST_EXTENSIONS.index(ext) < _TEST_EXTENSIONS.index(current.suffix):
+                    test_index[stem] = Path(entry.path)
+        return test_index
+
     def find_compilable_tests(self):
         """Find test files that have compiles_yes in verification reports"""
         print("Starting find_compilable_tests")
@@ -135,18 +469,19 @@ class AITestRunner:
             print(f"❌ Verification report directory not found: {self.verification_dir}")
             return compilable_tests
 
-        # Find all compiles_yes files
-        for report_file in self.verification_dir.glob("*compiles_yes.txt"):
+        # Find all compiles_yes files in one directory scan (glob semantics: no dotfiles)
+        report_names = [
+            entry.name for entry in os.scandir(self.verification_dir)
+            if entry.name.endswith("compiles_yes.txt") and not entry.name.startswith(".") and entry.is_file()
+        ]
+        for report_name in report_names:
             # Extract test filename from report filename
-            base_name = report_file.stem.replace("_compiles_yes", "")
-            
-            # Try both .c and .cpp extensions
-            for ext in ['.c', '.cpp', '.cc', '.cxx', '.c++']:
-                test_file = self.tests_dir / f"{base_name}{ext}"
-                if test_file.exists():
-                    compilable_tests.append(test_file)
-                    print(f"✅ Found compilable test: {test_file.name}")
-                    break
+            base_name = report_name[:-len(".txt")].replace("_compiles_yes", "")
+
+            test_file = self._test_file_index.get(base_name)
+            if test_file is not None:
+                compilable_tests.append(test_file)
+                print(f"✅ Found compilable test: {test_file.name}")
 
         return compilable_tests
 
@@ -157,54 +492,45 @@ class AITestRunner:
         # First try to copy from reference location
         unity_source = self.repo_path.parent / "ai-test-gemini-CLI" / "unity"
         if unity_source.exists() and any(unity_source.rglob("*.c")):
+            # Skip the copy entirely when the reference has not changed since the last one
+            stamp = unity_dest / ".stamp"
+            src_mtime = max(p.stat().st_mtime for p in unity_source.rglob("*") if p.is_file())
+            if stamp.exists() and stamp.stat().st_mtime >= src_mtime:
+                print("✅ Unity framework up to date")
+                return True
+
             if unity_dest.exists():
                 try:
-                    shutil.rmtree(unity_dest)
+                    _discard_tree(unity_dest)
                 except (OSError, PermissionError):
                     print(f"⚠️  Could not remove existing unity directory: {unity_dest}")
-            shutil.copytree(unity_source, unity_dest)
+            parallel_copytree(unity_source, unity_dest, copy_function=_link_or_copy)
+            stamp.touch()
             print("✅ Copied Unity framework from reference")
             return True
 
-        # If not available, download Unity
-        print("📥 Downloading Unity framework...")
-        import urllib.request
-        import zipfile
-        import tempfile
-
+        # If not available, use the user-wide cache, downloading Unity into it once
+        cache_dir = _unity_cache_dir()
+        src_dest = unity_dest / "src"
         try:
-            # Download Unity from GitHub
-            unity_url = "https://github.com/ThrowTheSwitch/Unity/archive/refs/heads/master.zip"
-            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as temp_zip:
-                temp_zip_path = temp_zip.name
-
-            # Download to the temp file
-            urllib.request.urlretrieve(unity_url, temp_zip_path)
-
-            # Extract Unity
-            with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
-                # Extract only the src directory
-                for member in zip_ref.namelist():
-                    if member.startswith('Unity-master/src/'):
-                        # Remove the Unity-master/src/ prefix
-                        target_path = member.replace('Unity-master/src/', 'src/')
-                        if target_path.endswith('/'):
-                            (unity_dest / target_path).mkdir(parents=True, exist_ok=True)
-                        else:
-                            zip_ref.extract(member, unity_dest.parent / "temp_unity")
-                            source_file = unity_dest.parent / "temp_unity" / member
-                            target_file = unity_dest / target_path
-                            target_file.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.move(source_file, target_file)
-
-            # Clean up
-            import os
-            os.unlink(temp_zip_path)
-            temp_dir = unity_dest.parent / "temp_unity"
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-
-            print("✅ Downloaded Unity framework")
+            if not cache_dir.is_dir():
+                _download_unity(cache_dir)
+            else:
+                print("✅ Using cached Unity framework")
+
+            if src_dest.is_symlink() and Path(os.readlink(src_dest)) == cache_dir:
+                return True
+
+            unity_dest.mkdir(parents=True, exist_ok=True)
+            if src_dest.is_symlink() or src_dest.is_file():
+                src_dest.unlink()
+            elif src_dest.exists():
+                _discard_tree(src_dest)
+            try:
+                os.symlink(cache_dir, src_dest, target_is_directory=True)
+            except OSError:
+                # Symlinks need extra privileges on Windows
+                parallel_copytree(cache_dir, src_dest, copy_function=_link_or_copy)
             return True
 
         except Exception as e:
@@ -293,8 +619,7 @@ int RUN_ALL_TESTS() {
     return TestRegistry::instance().run_all_tests();
 }
 '''
-            with open(gtest_dest, 'w') as f:
-                f.write(gtest_content)
+            _write_if_changed(gtest_dest, gtest_content)
             print("✅ Created minimal Google Test framework")
 
         # Copy Arduino stubs
@@ -504,10 +829,8 @@ const char* String::c_str() const {
     return data.c_str();
 }
 '''
-            with open(arduino_dest / "Arduino_stubs.h", 'w') as f:
-                f.write(arduino_h_content)
-            with open(arduino_dest / "Arduino_stubs.cpp", 'w') as f:
-                f.write(arduino_cpp_content)
+            _write_if_changed(arduino_dest / "Arduino_stubs.h", arduino_h_content)
+            _write_if_changed(arduino_dest / "Arduino_stubs.cpp", arduino_cpp_content)
             print("✅ Created minimal Arduino stubs")
 
         return True
@@ -522,25 +845,24 @@ const char* String::c_str() const {
             source_files = list(self.source_dir.glob("*.c")) + list(self.source_dir.glob("*.cpp"))
             
             for src_file in source_files:
-                with open(src_file, 'r') as f:
-                    content = f.read()
-                
-                # Rename main() to app_main() to allow testing it without conflicts
-                import re
-                if 'int main' in content:
-                    content = re.sub(r'\bint\s+main\s*\(', 'int app_main(', content)
-                    print(f"🔄 Renamed main() to app_main() in {src_file.name}")
-                
-                # Write to build directory
+                data = src_file.read_bytes()
                 dest_file = src_build_dir / src_file.name
-                with open(dest_file, 'w') as f:
-                    f.write(content)
+
+                # Rename main() to app_main() to allow testing it without conflicts.
+                # Only files that mention main are decoded; the probe runs on raw bytes.
+                if b'int main' in data:
+                    content = _MAIN_RE.sub('int app_main(', data.decode("utf-8"))
+                    print(f"🔄 Renamed main() to app_main() in {src_file.name}")
+                    dest_file.write_text(content, encoding="utf-8")
+                else:
+                    # Unchanged sources are copied by the OS without a round trip through Python
+                    shutil.copyfile(src_file, dest_file)
                 print(f"📋 Copied source: {src_file.name}")
                 
                 # Generate a header file (only for C files usually, but maybe useful for CPP too if missing)
                 if src_file.suffix == '.c':
                     header_file = src_build_dir / (src_file.stem + ".h")
-                    self._generate_header_from_source(src_file, header_file)
+                    self._generate_header_from_source(src_file, header_file, data)
 
             for header_file in self.source_dir.glob("*.h"):
                 shutil.copy2(header_file, src_build_dir)
@@ -548,19 +870,21 @@ const char* String::c_str() const {
         else:
             print(f"⚠️  Source directory not found: {self.source_dir}")
 
-    def _generate_header_from_source(self, src_file, dest_header):
-        """Generate a header file from source with function declarations"""
+    def _generate_header_from_source(self, src_file, dest_header, data=None):
+        """Generate a header file from source with function declarations
+
+        Callers that already hold the source's bytes pass them as data to avoid another read.
+        """
         try:
-            with open(src_file, 'r') as f:
-                content = f.read()
-            
+            if data is None:
+                data = src_file.read_bytes()
+            content = data.decode("utf-8").replace("\r\n", "\n")
+
             # Extract function definitions (anything that looks like a function)
-            import re
-            # Match patterns like: return_type function_name(parameters) {
-            pattern = r'(\w+\s+(\w+)\s*\([^)]*\))\s*\{'
-            matches = re.findall(pattern, content)
-            
-            if matches:
+            matches = _FUNC_DEF_RE.finditer(content)
+            first = next(matches, None)
+
+            if first is not None:
                 with open(dest_header, 'w') as f:
                     f.write(f"/* Auto-generated header for {src_file.name} */\n")
                     f.write("#pragma once\n\n")
@@ -568,9 +892,8 @@ const char* String::c_str() const {
                     f.write("#include <stdbool.h>\n")
                     f.write("#include <stdlib.h>\n\n")
                     
-                    for match in matches:
-                        func_name = match[1]
-                        func_decl = match[0]
+                    for match in itertools.chain((first,), matches):
+                        func_decl, func_name = match.groups()
                         # Skip main function
                         if func_name != 'main':
                             f.write(f"{func_decl};\n")
@@ -582,47 +905,32 @@ const char* String::c_str() const {
         """Copy test files to build directory"""
         tests_build_dir = self.output_dir / "tests"
         tests_build_dir.mkdir(exist_ok=True)
-        import re
 
         for test_file in test_files:
-            with open(test_file, 'r') as f:
-                content = f.read()
-            
+            original = content = test_file.read_text(encoding="utf-8")
+
             # For C tests, inject #include for the source C file to get implementations
             if test_file.name.endswith('.c') and '#include "unity.h"' in content:
-                # Determine source filename
-                test_name = test_file.stem
-                if test_name.startswith('test_'):
-                    source_name = test_name[5:]
-                else:
-                    source_name = test_name
-                
-                # Include the actual source C file (not header)
-                # Since test is in tests/ and source is in src/, use ../src/filename.c
-                source_file = f"../src/{source_name}.c"
-                if f'#include "{source_file}"' not in content and f'#include "../src/' not in content:
-                    # Find where to insert (after unity.h include)
-                    unity_pos = content.find('#include "unity.h"')
-                    if unity_pos != -1:
-                        # Find the end of the line
-                        eol = content.find('\n', unity_pos) + 1
-                        # Insert the include
-                        content = content[:eol] + f'#include "{source_file}"\n' + content[eol:]
-                        print(f"📝 Added #include for {source_file} to test file")
-                
+                source_name = _strip_test_prefix(test_file.stem)
+                included = _include_source_under_test(content, source_name)
+                if included != content:
+                    content = included
+                    print(f"📝 Added #include for ../src/{source_name}.c to test file")
+
                 # Replace calls to main() with app_main() to avoid recursion
                 # But don't replace the test runner's main definition (int main(void))
                 if 'app_main(' not in content:
-                    # Regex: match 'main(' not preceded by 'int ' or 'void '
-                    new_content = re.sub(r'(?<!\bint\s)(?<!\bvoid\s)\bmain\s*\(', 'app_main(', content)
-                    if new_content != content:
+                    new_content, replaced = _MAIN_CALL_RE.subn('app_main(', content)
+                    if replaced:
                         content = new_content
                         print(f"🔄 Replaced main() calls with app_main() in {test_file.name}")
             
             # Write the modified test file
             dest_file = tests_build_dir / test_file.name
-            with open(dest_file, 'w') as f:
-                f.write(content)
+            if content is original:
+                shutil.copyfile(test_file, dest_file)
+            else:
+                dest_file.write_text(content, encoding="utf-8")
             print(f"📋 Copied test: {test_file.name}")
 
     def create_cmake_lists(self, test_files, language):
@@ -634,78 +942,101 @@ const char* String::c_str() const {
 
     def create_c_cmake_lists(self, test_files):
         """Create CMakeLists.txt for C tests with Unity"""
-        cmake_content = "cmake_minimum_required(VERSION 3.10)\n"
-        cmake_content += "project(Tests C)\n\n"
-        cmake_content += "set(CMAKE_C_STANDARD 99)\n"
-        cmake_content += "add_definitions(-DUNIT_TEST)\n\n"
-        cmake_content += "set(CMAKE_C_FLAGS \"${CMAKE_C_FLAGS} --coverage\")\n"
-        cmake_content += "set(CMAKE_EXE_LINKER_FLAGS \"${CMAKE_EXE_LINKER_FLAGS} --coverage\")\n\n"
-        cmake_content += "include_directories(unity/src)\n"
-        cmake_content += "include_directories(src)\n\n"
-        cmake_content += "add_library(unity unity/src/unity.c)\n\n"
+        parts = [
+            "cmake_minimum_required(VERSION 3.10)",
+            "project(Tests C)",
+            "",
+            "set(CMAKE_C_STANDARD 99)",
+            "add_definitions(-DUNIT_TEST)",
+            "",
+            "set(CMAKE_C_FLAGS \"${CMAKE_C_FLAGS} --coverage\")",
+            "set(CMAKE_EXE_LINKER_FLAGS \"${CMAKE_EXE_LINKER_FLAGS} --coverage\")",
+            "",
+            "include_directories(unity/src)",
+            "include_directories(src)",
+            "",
+            "add_library(unity unity/src/unity.c)",
+            "",
+        ]
+        self._expected_executables = []
+
+        available_sources = set()
+        if self.source_dir.exists():
+            available_sources = {p.name for p in self.source_dir.glob("*.c")}
+        uut_targets = set()
 
         for test_file in test_files:
             test_name = os.path.splitext(os.path.basename(test_file))[0]
             executable_name = test_name
+            source_name = _strip_test_prefix(test_name)
 
-            # For C tests with Unity, only compile the test file
-            # The test file should include the source file to get function definitions
-            test_file_basename = os.path.basename(test_file).replace('\\', '/')
-            cmake_content += f"add_executable({executable_name} tests/{test_file_basename})\n"
-            cmake_content += f"target_link_libraries({executable_name} unity)\n\n"
+            # Tests that #include their source (as written, or as copy_test_files will
+            # rewrite them) already contain it; link the others against the source
+            # compiled once as an object library
+            try:
+                content = Path(test_file).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                content = ""
+            content = _include_source_under_test(content, source_name)
+            embeds_source = f"{source_name}.c" in _C_SOURCE_INCLUDE_RE.findall(content)
 
-        with open(os.path.join(self.output_dir, 'CMakeLists.txt'), 'w') as f:
-            f.write(cmake_content)
+            test_file_basename = os.path.basename(test_file).replace('\\', '/')
+            test_sources = [f"tests/{test_file_basename}"]
+            if not embeds_source and f"{source_name}.c" in available_sources:
+                uut_target = f"{source_name}_uut"
+                if uut_target not in uut_targets:
+                    uut_targets.add(uut_target)
+                    parts.append(f"add_library({uut_target} OBJECT src/{source_name}.c)")
+                test_sources.append(f"$<TARGET_OBJECTS:{uut_target}>")
+
+            self._expected_executables.append(executable_name)
+            parts.append(f"add_executable({executable_name} {' '.join(test_sources)})")
+            parts.append(f"target_link_libraries({executable_name} unity)")
+            parts.append("")
+
+        (self.output_dir / "CMakeLists.txt").write_text("\n".join(parts) + "\n")
         print(f"✅ Created CMakeLists.txt for C tests with {len(test_files)} targets")
         return True
 
     def create_cpp_cmake_lists(self, test_files):
         """Create CMakeLists.txt for C++ tests with Google Test"""
-        cmake_content = "cmake_minimum_required(VERSION 3.14)\n"
-        cmake_content += "project(cpp_tests CXX)\n\n"
-        cmake_content += "set(CMAKE_CXX_STANDARD 17)\n"
-        cmake_content += "set(CMAKE_CXX_STANDARD_REQUIRED ON)\n\n"
-        cmake_content += "enable_testing()\n\n"
+        parts = [
+            "cmake_minimum_required(VERSION 3.14)",
+            "project(cpp_tests CXX)",
+            "",
+            "set(CMAKE_CXX_STANDARD 17)",
+            "set(CMAKE_CXX_STANDARD_REQUIRED ON)",
+            "",
+            "enable_testing()",
+            "",
+        ]
+        self._expected_executables = []
 
         # Add source files under test
         source_files = []
         if self.source_dir.exists():
-            for ext in ['.cpp', '.cc', '.cxx', '.c++']:
+            for ext in _CPP_EXTENSIONS:
                 source_files.extend(self.source_dir.glob(f"*{ext}"))
 
         if source_files:
-            cmake_content += "# Source code under test\n"
-            cmake_content += "add_library(test_lib OBJECT\n"
-            for src_file in source_files:
-                cmake_content += f"  src/{src_file.name}\n"
-            cmake_content += ")\n"
-            cmake_content += "target_include_directories(test_lib PUBLIC ${CMAKE_CURRENT_SOURCE_DIR}/src)\n"
-            cmake_content += "target_include_directories(test_lib PUBLIC arduino_stubs)\n"
-            cmake_content += "target_include_directories(test_lib PUBLIC gtest)\n\n"
+            parts.append("# Source code under test")
+            parts.append("add_library(test_lib OBJECT")
+            parts.extend(f"  src/{src_file.name}" for src_file in source_files)
+            parts.append(")")
+            parts.append("target_include_directories(test_lib PUBLIC ${CMAKE_CURRENT_SOURCE_DIR}/src)")
+            parts.append("target_include_directories(test_lib PUBLIC arduino_stubs)")
+            parts.append("target_include_directories(test_lib PUBLIC gtest)")
+            parts.append("")
 
         # Add test executables
+        objects = "  $<TARGET_OBJECTS:test_lib>\n" if source_files else ""
         for test_file in test_files:
-            test_name = test_file.stem
-            cmake_content += f"# Test executable for {test_name}\n"
-            cmake_content += f"add_executable({test_name}\n"
-            cmake_content += f"  tests/{test_file.name}\n"
-            cmake_content += f"  arduino_stubs/Arduino_stubs.cpp\n"
-            if source_files:
-                cmake_content += f"  $<TARGET_OBJECTS:test_lib>\n"
-            cmake_content += ")\n"
-            cmake_content += f"target_include_directories({test_name} PRIVATE ${{CMAKE_CURRENT_SOURCE_DIR}})\n"
-            cmake_content += f"target_include_directories({test_name} PRIVATE ${{CMAKE_CURRENT_SOURCE_DIR}}/src)\n"
-            cmake_content += f"target_include_directories({test_name} PRIVATE arduino_stubs)\n"
-            cmake_content += f"target_include_directories({test_name} PRIVATE gtest)\n\n"
-            cmake_content += f"add_test(\n"
-            cmake_content += f"  NAME {test_name}\n"
-            cmake_content += f"  COMMAND {test_name}\n"
-            cmake_content += ")\n\n"
+            self._expected_executables.append(test_file.stem)
+            parts.append(_CPP_TEST_TARGET_TEMPLATE.format(name=test_file.stem, fname=test_file.name, objects=objects))
 
         # Write CMakeLists.txt
         cmake_file = self.output_dir / "CMakeLists.txt"
-        with open(cmake_file, 'w') as f:
-            f.write(cmake_content)
+        cmake_file.write_text("\n".join(parts) + "\n")
 
         print("✅ Created CMakeLists.txt for C++ tests")
         return True
@@ -715,9 +1046,9 @@ const char* String::c_str() const {
         print("🔨 Building tests...")
 
         try:
-            # Configure with CMake
+            # Configure with CMake (Ninja schedules the build graph in parallel)
             result = subprocess.run(
-                ["cmake", "."],
+                ["cmake", *cmake_generator_args(self.output_dir), "."],
                 cwd=self.output_dir,
                 capture_output=True,
                 text=True,
@@ -725,9 +1056,9 @@ const char* String::c_str() const {
             )
             print("✅ CMake configuration successful")
 
-            # Build with cmake --build
+            # Build with cmake --build, using every core
             result = subprocess.run(
-                ["cmake", "--build", "."],
+                ["cmake", "--build", ".", "--parallel", str(self.build_jobs)],
                 cwd=self.output_dir,
                 capture_output=True,
                 text=True,
@@ -751,131 +1082,138 @@ const char* String::c_str() const {
         print("🧪 Running tests...")
 
         test_results = []
-        test_executables = [exe for exe in self.output_dir.glob("*test*") 
-                           if exe.is_file() and exe.suffix in ['.exe', ''] and 'CTest' not in exe.name]
+        if self._expected_executables:
+            # The generated CMakeLists.txt already names every target; no directory scan needed
+            exe_suffix = '.exe' if os.name == 'nt' else ''
+            candidates = [self.output_dir / f"{name}{exe_suffix}" for name in self._expected_executables]
+        else:
+            candidates = [exe for exe in self.output_dir.glob("*test*")
+                          if exe.suffix in ['.exe', ''] and 'CTest' not in exe.name]
+        test_executables = [exe for exe in candidates if _is_executable_file(exe)]
 
         if not test_executables:
             print("❌ No test executables found")
             return test_results
 
-        for exe in test_executables:
-            if exe.is_file() and os.access(exe, os.X_OK):
-                print(f"   Running {exe.name}...")
-                try:
-                    result = subprocess.run(
-                        [str(exe)],
-                        cwd=self.output_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=30
-                    )
-
-                    # Parse test output
-                    individual_tests = 0
-                    individual_passed = 0
-                    individual_failed = 0
-
-                    for line in result.stdout.split('\n'):
-                        line = line.strip()
-                        if ':PASS' in line:
-                            individual_tests += 1
-                            individual_passed += 1
-                        elif ':FAIL' in line:
-                            individual_tests += 1
-                            individual_failed += 1
-                        elif line.endswith('Tests') and 'Failures' in line:
-                            parts = line.split()
-                            if len(parts) >= 3:
-                                try:
-                                    individual_tests = int(parts[0])
-                                    individual_failed = int(parts[2])
-                                    individual_passed = individual_tests - individual_failed
-                                except ValueError:
-                                    pass
-
-                    success = result.returncode == 0
-                    test_results.append({
-                        'name': exe.name,
-                        'success': success,
-                        'output': result.stdout,
-                        'errors': result.stderr,
-                        'returncode': result.returncode,
-                        'individual_tests': individual_tests,
-                        'individual_passed': individual_passed,
-                        'individual_failed': individual_failed
-                    })
+        # Each test's stdout is written to results/<executable>.out
+        (self.output_dir / "results").mkdir(exist_ok=True)
 
-                    status = "✅" if success else "❌"
-                    if individual_tests > 0:
-                        print(f"   {status} {exe.name} ({individual_passed}/{individual_tests} tests passed)")
-                    else:
-                        print(f"   {status} {exe.name} (exit code: {result.returncode})")
-
-                except subprocess.TimeoutExpired:
-                    test_results.append({
-                        'name': exe.name,
-                        'success': False,
-                        'output': '',
-                        'errors': 'Test timed out',
-                        'returncode': -1,
-                        'individual_tests': 0,
-                        'individual_passed': 0,
-                        'individual_failed': 0
-                    })
-                    print(f"   ⏰ {exe.name} timed out")
-
-                except Exception as e:
-                    test_results.append({
-                        'name': exe.name,
-                        'success': False,
-                        'output': '',
-                        'errors': str(e),
-                        'returncode': -1,
-                        'individual_tests': 0,
-                        'individual_passed': 0,
-                        'individual_failed': 0
-                    })
-                    print(f"   ❌ {exe.name} failed: {e}")
+        # Test binaries are independent processes, so run them concurrently
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = [executor.submit(self._run_test_executable, exe) for exe in test_executables]
+            for future in as_completed(futures):
+                test_results.append(future.result())
 
+        # Keep report order stable regardless of completion order
+        test_results.sort(key=lambda r: r['name'])
         return test_results
 
+    def _run_test_executable(self, exe):
+        """Run a single test executable and return its result record"""
+        print(f"   Running {exe.name}...")
+        try:
+            # stdout goes straight to a file, so there is no pipe for this thread to drain
+            out_path = self.output_dir / "results" / f"{exe.name}.out"
+            with open(out_path, "wb") as out_file:
+                result = subprocess.run(
+                    [str(exe)],
+                    cwd=self.output_dir,
+                    stdout=out_file,
+                    stderr=subprocess.PIPE,
+                    timeout=_TEST_TIMEOUT
+                )
+            returncode = result.returncode
+            errors = result.stderr.decode('utf-8', errors='replace')
+
+            # Parse test output
+            output = out_path.read_bytes()
+            hits = _RESULT_RE.findall(output)
+            individual_passed = hits.count(b'PASS')
+            individual_failed = len(hits) - individual_passed
+            individual_tests = len(hits)
+            # Unity's final "N Tests M Failures K Ignored" line is authoritative
+            summary = _SUMMARY_RE.search(output)
+            if summary:
+                individual_tests = int(summary.group(1))
+                individual_failed = int(summary.group(2))
+                individual_passed = individual_tests - individual_failed
+
+            success = returncode == 0
+            status = "✅" if success else "❌"
+            if individual_tests > 0:
+                print(f"   {status} {exe.name} ({individual_passed}/{individual_tests} tests passed)")
+            else:
+                print(f"   {status} {exe.name} (exit code: {returncode})")
+
+            return {
+                'name': exe.name,
+                'success': success,
+                'output': output.decode('utf-8', errors='replace'),
+                'errors': errors,
+                'returncode': returncode,
+                'individual_tests': individual_tests,
+                'individual_passed': individual_passed,
+                'individual_failed': individual_failed
+            }
+
+        except subprocess.TimeoutExpired:
+            print(f"   ⏰ {exe.name} timed out")
+            return {
+                'name': exe.name,
+                'success': False,
+                'output': '',
+                'errors': 'Test timed out',
+                'returncode': -1,
+                'individual_tests': 0,
+                'individual_passed': 0,
+                'individual_failed': 0
+            }
+
+        except Exception as e:
+            print(f"   ❌ {exe.name} failed: {e}")
+            return {
+                'name': exe.name,
+                'success': False,
+                'output': '',
+                'errors': str(e),
+                'returncode': -1,
+                'individual_tests': 0,
+                'individual_passed': 0,
+                'individual_failed': 0
+            }
+
     def generate_test_reports(self, test_results):
         """Generate individual test reports"""
         print(f"📝 Generating test reports in {self.test_reports_dir}...")
 
-        for result in test_results:
-            report_file = self.test_reports_dir / f"{result['name']}_report.txt"
-
-            with open(report_file, 'w', encoding='utf-8') as f:
-                f.write("=" * 60 + "\n")
-                f.write(f"TEST REPORT: {result['name']}\n")
-                f.write("=" * 60 + "\n\n")
-
-                f.write("EXECUTION SUMMARY\n")
-                f.write("-" * 20 + "\n")
-                f.write(f"Test Executable: {result['name']}\n")
-                f.write(f"Exit Code: {result['returncode']}\n")
-                f.write(f"Overall Status: {'PASSED' if result['success'] else 'FAILED'}\n")
-                f.write(f"Individual Tests Run: {result['individual_tests']}\n")
-                f.write(f"Individual Tests Passed: {result['individual_passed']}\n")
-                f.write(f"Individual Tests Failed: {result['individual_failed']}\n\n")
-
-                if result['errors']:
-                    f.write("ERRORS\n")
-                    f.write("-" * 10 + "\n")
-                    f.write(f"{result['errors']}\n\n")
-
-                f.write("DETAILED OUTPUT\n")
-                f.write("-" * 20 + "\n")
-                if result['output']:
-                    f.write(result['output'])
-                else:
-                    f.write("(No output captured)\n")
+        if not test_results:
+            return
 
-                f.write("\n" + "=" * 60 + "\n")
+        # Each report is an independent file, so overlap the writes
+        with ThreadPoolExecutor(max_workers=min(32, len(test_results))) as executor:
+            report_files = list(executor.map(self._write_one_report, test_results))
 
+        for report_file in report_files:
             print(f"   📄 Generated report: {report_file.name}")
 
+    def _write_one_report(self, result):
+        """Write the report for a single test executable and return its path"""
+        report_file = self.test_reports_dir / f"{result['name']}_report.txt"
+        errors = f"ERRORS\n{_REPORT_ERRORS_RULE}\n{result['errors']}\n\n" if result['errors'] else ""
+        report_file.write_text(_TEST_REPORT_TEMPLATE.format(
+            rule=_REPORT_RULE,
+            subrule=_REPORT_SUBRULE,
+            name=result['name'],
+            returncode=result['returncode'],
+            status='PASSED' if result['success'] else 'FAILED',
+            tests=result['individual_tests'],
+            passed=result['individual_passed'],
+            failed=result['individual_failed'],
+            errors=errors,
+            output=result['output'] or "(No output captured)\n",
+        ), encoding='utf-8')
+        return report_file
+
     def generate_coverage(self):
         """Generate coverage reports (placeholder)"""
         print("📊 Coverage reporting not yet implemented")
@@ -884,68 +1222,84 @@ const char* String::c_str() const {
     def create_cmake_lists(self, test_files, language):
         """Create CMakeLists.txt in repo root for CMake build"""
         cmake_path = self.repo_path / "CMakeLists.txt"
-        with open(cmake_path, 'w') as f:
-            f.write("cmake_minimum_required(VERSION 3.14)\n")
-            f.write("project(TestProject CXX)\n\n")
-            
-            f.write("set(CMAKE_CXX_STANDARD 17)\n")
-            f.write("set(CMAKE_CXX_STANDARD_REQUIRED ON)\n\n")
-            
-            f.write("# Enable testing\n")
-            f.write("enable_testing()\n\n")
-            
-            if language == "cpp":
-                f.write("# Google Test setup\n")
+        self._expected_executables = []
+        parts = [
+            "cmake_minimum_required(VERSION 3.14)",
+            "project(TestProject CXX)",
+            "",
+            "set(CMAKE_CXX_STANDARD 17)",
+            "set(CMAKE_CXX_STANDARD_REQUIRED ON)",
+            "",
+            "# Enable testing",
+            "enable_testing()",
+            "",
+        ]
+
+        if language == "cpp":
+            parts.extend([
+                "# Google Test setup",
                 # Disable SSL verification for download to avoid certificate issues
-                f.write("set(CMAKE_TLS_VERIFY 0)\n")
-                f.write("include(FetchContent)\n")
-                f.write("FetchContent_Declare(\n")
-                f.write("  googletest\n")
-                f.write("  URL https://github.com/google/googletest/archive/refs/tags/v1.14.0.zip\n")
-                f.write(")\n")
-                f.write("# For Windows: Prevent overriding the parent project's compiler/linker settings\n")
-                f.write("set(gtest_force_shared_crt ON CACHE BOOL \"\" FORCE)\n")
-                f.write("FetchContent_MakeAvailable(googletest)\n\n")
-                
-                f.write("include_directories(${gtest_SOURCE_DIR}/include)\n\n")
+                "set(CMAKE_TLS_VERIFY 0)",
+                "include(FetchContent)",
+                "FetchContent_Declare(",
+                "  googletest",
+                "  URL https://github.com/google/googletest/archive/refs/tags/v1.14.0.zip",
+                ")",
+                "# For Windows: Prevent overriding the parent project's compiler/linker settings",
+                "set(gtest_force_shared_crt ON CACHE BOOL \"\" FORCE)",
+                "FetchContent_MakeAvailable(googletest)",
+                "",
+                "include_directories(${gtest_SOURCE_DIR}/include)",
+                "",
+            ])
+
+        # List candidate sources once instead of stat-ing two paths per test
+        src_dir = self.repo_path / "src"
+        src_files = {e.name for e in os.scandir(src_dir) if e.is_file()} if src_dir.is_dir() else set()
+        root_files = {e.name for e in os.scandir(self.repo_path) if e.is_file()}
 
-            for test_file in test_files:
-                # Assume test files are in tests/ directory
-                exe_name = test_file.stem
-                
-                # Determine source file name (assuming test_X.cpp tests X.cpp)
-                source_name = test_file.stem
-                if source_name.startswith("test_"):
-                    source_name = source_name[5:]
-                
-                # Look for source file in src/ or root
-                source_file_path = self.repo_path / "src" / f"{source_name}.cpp"
-                if not source_file_path.exists():
-                     # Try root
-                     source_file_path = self.repo_path / f"{source_name}.cpp"
-                
-                # If source file exists, create a library for it
-                if source_file_path.exists():
-                    lib_name = f"{source_name}_lib"
-                    # Use relative path for CMake
-                    rel_source_path = source_file_path.relative_to(self.repo_path).as_posix()
-                    
-                    f.write(f"add_library({lib_name} OBJECT {rel_source_path})\n")
-                    f.write(f"target_include_directories({lib_name} PUBLIC ${{CMAKE_CURRENT_SOURCE_DIR}})\n")
-                    f.write(f"target_include_directories({lib_name} PUBLIC ${{CMAKE_BINARY_DIR}}/arduino_stubs)\n\n")
-                    
-                    f.write(f"add_executable({exe_name} tests/{test_file.name} ${{CMAKE_BINARY_DIR}}/arduino_stubs/Arduino_stubs.cpp $<TARGET_OBJECTS:{lib_name}>)\n")
-                else:
-                    # Fallback: just compile test file (might fail linking)
-                    f.write(f"add_executable({exe_name} tests/{test_file.name} ${{CMAKE_BINARY_DIR}}/arduino_stubs/Arduino_stubs.cpp)\n")
+        for test_file in test_files:
+            # Assume test files are in tests/ directory
+            exe_name = test_file.stem
+            self._expected_executables.append(exe_name)
+
+            # Determine source file name (assuming test_X.cpp tests X.cpp)
+            source_name = _strip_test_prefix(test_file.stem)
+
+            # Look for source file in src/ or root
+            source_filename = f"{source_name}.cpp"
+            if source_filename in src_files:
+                source_file_path = src_dir / source_filename
+            elif source_filename in root_files:
+                source_file_path = self.repo_path / source_filename
+            else:
+                source_file_path = None
+
+            # If source file exists, create a library for it
+            if source_file_path is not None:
+                lib_name = f"{source_name}_lib"
+                # Use relative path for CMake
+                rel_source_path = source_file_path.relative_to(self.repo_path).as_posix()
+
+                parts.append(f"add_library({lib_name} OBJECT {rel_source_path})")
+                parts.append(f"target_include_directories({lib_name} PUBLIC ${{CMAKE_CURRENT_SOURCE_DIR}})")
+                parts.append(f"target_include_directories({lib_name} PUBLIC ${{CMAKE_BINARY_DIR}}/arduino_stubs)")
+                parts.append("")
+
+                parts.append(f"add_executable({exe_name} tests/{test_file.name} ${{CMAKE_BINARY_DIR}}/arduino_stubs/Arduino_stubs.cpp $<TARGET_OBJECTS:{lib_name}>)")
+            else:
+                # Fallback: just compile test file (might fail linking)
+                parts.append(f"add_executable({exe_name} tests/{test_file.name} ${{CMAKE_BINARY_DIR}}/arduino_stubs/Arduino_stubs.cpp)")
+
+            if language == "cpp":
+                parts.append(f"target_link_libraries({exe_name} GTest::gtest_main)")
+
+            parts.append(f"target_include_directories({exe_name} PRIVATE ${{CMAKE_CURRENT_SOURCE_DIR}} ${{CMAKE_CURRENT_SOURCE_DIR}}/src ${{CMAKE_BINARY_DIR}}/arduino_stubs)")
+
+            parts.append(f"add_test(NAME {exe_name} COMMAND {exe_name})")
+
+        cmake_path.write_text("\n".join(parts) + "\n")
 
-                if language == "cpp":
-                    f.write(f"target_link_libraries({exe_name} GTest::gtest_main)\n")
-                
-                f.write(f"target_include_directories({exe_name} PRIVATE ${{CMAKE_CURRENT_SOURCE_DIR}} ${{CMAKE_CURRENT_SOURCE_DIR}}/src ${{CMAKE_BINARY_DIR}}/arduino_stubs)\n")
-                
-                f.write(f"add_test(NAME {exe_name} COMMAND {exe_name})\n")
-                
         print(f"📝 Created CMakeLists.txt at {cmake_path}")
         return True
 
@@ -980,18 +1334,22 @@ const char* String::c_str() const {
         # Create CMakeLists.txt
         # self.create_cmake_lists(test_files, language)  # Project already has CMakeLists.txt
 
-        # Configure CMake
-        print("🔧 Configuring CMake...")
-        try:
-            subprocess.run(["cmake", "-S", str(self.repo_path), "-B", str(self.output_dir), "-DRAILWAY_FETCH_GTEST=ON"], check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"❌ CMake configuration failed: {e}")
-            return False
+        # Configure CMake, unless the build tree is already configured for this repo
+        if needs_configure(self.output_dir, self.repo_path, _RUN_CMAKE_OPTIONS):
+            print("🔧 Configuring CMake...")
+            options = [f"-D{name}={value}" for name, value in _RUN_CMAKE_OPTIONS.items()]
+            try:
+                subprocess.run(["cmake", *cmake_generator_args(self.output_dir), "-S", str(self.repo_path), "-B", str(self.output_dir), *options], check=True)
+            except subprocess.CalledProcessError as e:
+                print(f"❌ CMake configuration failed: {e}")
+                return False
+        else:
+            print("✅ CMake cache up to date, skipping configure")
 
         # Build tests
         print("🔨 Building tests...")
         try:
-            subprocess.run(["cmake", "--build", "."], cwd=self.output_dir, check=True)
+            subprocess.run(["cmake", "--build", ".", "--parallel", str(self.build_jobs)], cwd=self.output_dir, check=True)
         except subprocess.CalledProcessError as e:
             print(f"❌ Build failed: {e}")
             return False
@@ -999,36 +1357,57 @@ const char* String::c_str() const {
         # Run tests
         print("🧪 Running tests...")
         try:
-            result = subprocess.run(["ctest", "--output-on-failure"], cwd=self.output_dir, capture_output=True, text=True)
-            combined_output = (result.stdout or "") + (result.stderr or "")
-            no_tests_found = "No tests were found" in combined_output
-            test_results = [{
-                "passed": (result.returncode == 0) and (not no_tests_found),
-                "output": combined_output,
-            }]
+            # Log ctest to a file (stderr merged) rather than buffering it through pipes;
+            # per-test results come from its JUnit report where CTest can write one
+            ctest_log = self.output_dir / "results" / "ctest.log"
+            junit_path = self.output_dir / "results" / "ctest.xml"
+            ctest_log.parent.mkdir(exist_ok=True)
+            junit_path.unlink(missing_ok=True)
+            ctest_cmd = ["ctest", "--output-on-failure", "-j", str(self.jobs)]
+            if _ctest_supports_junit():
+                ctest_cmd += ["--output-junit", str(junit_path)]
+            with open(ctest_log, "wb") as log_file:
+                result = subprocess.run(
+                    ctest_cmd,
+                    cwd=self.output_dir,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT
+                )
+            combined_output = ctest_log.read_text(encoding="utf-8", errors="replace")
+            if junit_path.exists():
+                test_results = _parse_ctest_junit(junit_path)
+                passed = sum(1 for r in test_results if r["passed"])
+                print(f"   {passed}/{len(test_results)} CTest tests passed")
+                all_passed = bool(test_results) and passed == len(test_results)
+            else:
+                # No JUnit report (CTest before 3.21): judge by exit status and log
+                no_tests_found = "No tests were found" in combined_output
+                all_passed = result.returncode == 0 and not no_tests_found
             # Emit per-test-case report for GoogleTest executables (function-scenario granularity).
             try:
-                self._write_gtest_case_reports(result)
+                self._write_gtest_case_reports(result, ctest_output=combined_output)
             except Exception:
                 pass
 
             # CTest data is now included in the interlocking_test_report.txt, no separate file needed
         except subprocess.CalledProcessError as e:
             print(f"❌ Tests failed: {e}")
-            test_results = []
+            all_passed = False
 
-        if not test_results or not test_results[0]["passed"]:
+        if not all_passed:
             print("❌ No tests were executed or tests failed")
             return False
 
         print("✅ All tests passed!")
-        print(f"📄 Test Output:\n{test_results[0]['output']}")
+        print(f"📄 Test Output:\n{combined_output}")
 
         return True
 
-    def _write_gtest_case_reports(self, ctest_result=None):
-        """Run each built gtest executable with XML output and summarize per test case."""
-        import xml.etree.ElementTree as ET
+    def _write_gtest_case_reports(self, ctest_result=None, ctest_output: str = ""):
+        """Run each built gtest executable with XML output and summarize per test case.
+
+        ctest_output is CTest's logged console output, stderr included.
+        """
         tests_bin_dir = self.output_dir / "tests"
         if not tests_bin_dir.exists():
             return
@@ -1043,11 +1422,12 @@ const char* String::c_str() const {
         for exe in exes:
             xml_path = self.test_reports_dir / "interlocking_test_report.xml"
             try:
-                run = subprocess.run(
+                # Only the XML file is read, so the console output is discarded
+                subprocess.run(
                     [str(exe), f"--gtest_output=xml:{xml_path}"],
                     cwd=tests_bin_dir,
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=60,
                 )
             except Exception:
@@ -1099,7 +1479,7 @@ const char* String::c_str() const {
                 f.write("CTEST SUMMARY\n")
                 f.write("=" * 60 + "\n\n")
                 if ctest_result:
-                    combined_output = (ctest_result.stdout or "") + (ctest_result.stderr or "")
+                    combined_output = ctest_output + (ctest_result.stderr or "")
                     no_tests_found = "No tests were found" in combined_output
                     f.write(f"Return code: {ctest_result.returncode}\n\n")
                     if no_tests_found:
@@ -1107,7 +1487,7 @@ const char* String::c_str() const {
                     else:
                         f.write("STATUS: COMPLETED\n\n")
                     f.write("--- STDOUT/STDERR ---\n")
-                    f.write(ctest_result.stdout or "")
+                    f.write(ctest_output)
                     if ctest_result.stderr:
                         f.write("\n--- STDERR ---\n")
                         f.write(ctest_result.stderr)
@@ -1136,6 +1516,18 @@ def main():
         default="auto",
         help="Programming language (default: auto-detect)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help="Number of test executables to run concurrently (default: CPU count)"
+    )
+    parser.add_argument(
+        "--build-jobs",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help="Number of parallel compile jobs passed to cmake --build (default: CPU count)"
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -1148,7 +1540,7 @@ def main():
     _enforce_manual_review_gate(Path(args.repo_path).resolve())
 
     # Create and run the test runner
-    runner = AITestRunner(args.repo_path, args.output_dir, args.language)
+    runner = AITestRunner(args.repo_path, args.output_dir, args.language, args.jobs, args.build_jobs)
     success = runner.run()
 
     # Exit with appropriate code
@@ -4,11 +4,17 @@ import sys
 import glob
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ai_test_runner.cli import cmake_generator_args, needs_configure, parallel_copytree, positive_int
 
 def main():
     parser = argparse.ArgumentParser(description="Generate and run C++ tests for a repository")
     parser.add_argument('--repo-path', required=True, help='Path to the C++ repository to test')
     parser.add_argument('--generator-path', default=r'c:\Users\SwathantraPulicherla\workspaces\CPP\CW_Test_Gen', help='Path to the test generator')
+    parser.add_argument('--clean', action='store_true', help='Delete the build directory first and rebuild from scratch')
+    parser.add_argument('--build-jobs', type=positive_int, default=os.cpu_count() or 1, help='Number of parallel compile jobs (default: CPU count)')
+    parser.add_argument('--gen-jobs', type=positive_int, default=4, help='Number of test generations to run concurrently (default: 4)')
     args = parser.parse_args()
 
     REPO_ROOT = os.path.abspath(args.repo_path)
@@ -26,8 +32,7 @@ def main():
     print("\n=== Step 1: Generating Tests ===")
     source_files = [f for f in os.listdir(REPO_ROOT) if f.endswith('.cpp') and not f.startswith('test_')]
     
-    for src_file in source_files:
-        print(f"Processing {src_file}...")
+    def _gen(src_file):
         cmd = [
             sys.executable, "-m", "ai_c_test_generator.cli",
             "--repo-path", REPO_ROOT,
@@ -35,16 +40,31 @@ def main():
             "--file", src_file,
             "--output", TESTS_DIR
         ]
-        
-        try:
-            subprocess.run(cmd, cwd=GENERATOR_DIR, check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to generate test for {src_file}: {e}")
-            continue
+        print(f"Processing {src_file}...")
+        result = subprocess.run(cmd, cwd=GENERATOR_DIR, check=False, capture_output=True, text=True)
+        return src_file, result
+
+    # Each generation is dominated by API latency, so overlap them. Each generator's
+    # output is shown in one block as it finishes, since concurrent runs would interleave
+    failed = 0
+    with ThreadPoolExecutor(max_workers=args.gen_jobs) as executor:
+        futures = [executor.submit(_gen, src_file) for src_file in source_files]
+        for future in as_completed(futures):
+            src_file, result = future.result()
+            print(f"--- {src_file} ---")
+            if result.stdout:
+                print(result.stdout, end="" if result.stdout.endswith("\n") else "\n")
+            if result.returncode != 0:
+                failed += 1
+                if result.stderr:
+                    print(result.stderr, end="" if result.stderr.endswith("\n") else "\n")
+                print(f"Failed to generate test for {src_file} (exit code {result.returncode})")
+    print(f"Generated tests for {len(source_files) - failed}/{len(source_files)} source files")
 
     # 2. Configure CMake
     print("\n=== Step 2: Configuring CMake ===")
-    if os.path.exists(BUILD_DIR):
+    # Keep the build tree between runs so CMake can build incrementally
+    if args.clean and os.path.exists(BUILD_DIR):
         shutil.rmtree(BUILD_DIR)
     os.makedirs(BUILD_DIR, exist_ok=True)
     
@@ -54,12 +74,13 @@ def main():
     gtest_src = os.path.join(cw_test_run_dir, "gtest")
     
     if os.path.exists(stubs_src):
-        shutil.copytree(stubs_src, os.path.join(BUILD_DIR, "stubs"))
+        parallel_copytree(stubs_src, os.path.join(BUILD_DIR, "stubs"))
     if os.path.exists(gtest_src):
-        shutil.copytree(gtest_src, os.path.join(BUILD_DIR, "gtest"))
+        parallel_copytree(gtest_src, os.path.join(BUILD_DIR, "gtest"))
     
-    # Generate CMakeLists.txt dynamically
-    cmake_content = f"""cmake_minimum_required(VERSION 3.14)
+    # Generate CMakeLists.txt; CMake lists the test files itself in one glob,
+    # and CONFIGURE_DEPENDS re-runs it when test files are added or removed
+    cmake_content = """cmake_minimum_required(VERSION 3.14)
 project(CTestRunner CXX)
 
 set(CMAKE_CXX_STANDARD 17)
@@ -68,64 +89,69 @@ set(CMAKE_CXX_STANDARD_REQUIRED ON)
 enable_testing()
 
 # Define paths
-set(TEST_SUPPORT_DIR ${{CMAKE_CURRENT_SOURCE_DIR}}/../stubs) 
-set(GTEST_DIR ${{CMAKE_CURRENT_SOURCE_DIR}}/../gtest)
-set(STUBS_DIR ${{TEST_SUPPORT_DIR}})
+set(TEST_SUPPORT_DIR ${CMAKE_CURRENT_SOURCE_DIR}/../stubs) 
+set(GTEST_DIR ${CMAKE_CURRENT_SOURCE_DIR}/../gtest)
+set(STUBS_DIR ${TEST_SUPPORT_DIR})
 
 # Include directories
-include_directories(${{CMAKE_CURRENT_SOURCE_DIR}}/../)
-include_directories(${{GTEST_DIR}})
-include_directories(${{STUBS_DIR}})
-
-# Helper function to add a test
-function(add_component_test component_name)
-    set(SOURCE_FILE ${{CMAKE_CURRENT_SOURCE_DIR}}/../../{component_name}.cpp)
-    set(TEST_FILE ${{CMAKE_CURRENT_SOURCE_DIR}}/../test_{component_name}.cpp)
-
-    if(EXISTS ${{TEST_FILE}})
-        message(STATUS "Adding test target: test_${{component_name}}")
-        add_executable(test_${{component_name}}
-            ${{TEST_FILE}}
-            ${{SOURCE_FILE}}
-            ${{STUBS_DIR}}/Arduino_stubs.cpp
-            ${{STUBS_DIR}}/HTTPClient.cpp
-            ${{STUBS_DIR}}/SPIFFS.cpp
+include_directories(${CMAKE_CURRENT_SOURCE_DIR}/../)
+include_directories(${GTEST_DIR})
+include_directories(${STUBS_DIR})
+
+# Add a test target for every test file, found with a single directory read;
+# tests whose component source is missing are skipped rather than breaking the build
+file(GLOB TEST_SOURCES CONFIGURE_DEPENDS RELATIVE ${CMAKE_CURRENT_SOURCE_DIR}/.. ${CMAKE_CURRENT_SOURCE_DIR}/../test_*.cpp)
+foreach(test_src ${TEST_SOURCES})
+    string(REGEX REPLACE "^test_(.*)\\\\.cpp$" "\\\\1" component_name ${test_src})
+    set(SOURCE_FILE ${CMAKE_CURRENT_SOURCE_DIR}/../../${component_name}.cpp)
+    if(EXISTS ${SOURCE_FILE})
+        message(STATUS "Adding test target: test_${component_name}")
+        add_executable(test_${component_name}
+            ${CMAKE_CURRENT_SOURCE_DIR}/../${test_src}
+            ${SOURCE_FILE}
+            ${STUBS_DIR}/Arduino_stubs.cpp
+            ${STUBS_DIR}/HTTPClient.cpp
+            ${STUBS_DIR}/SPIFFS.cpp
         )
-        
+
         # Add include directories specifically for this target
-        target_include_directories(test_${{component_name}} PRIVATE 
-            ${{CMAKE_CURRENT_SOURCE_DIR}}/../..
-            ${{GTEST_DIR}}
-            ${{STUBS_DIR}}
+        target_include_directories(test_${component_name} PRIVATE 
+            ${CMAKE_CURRENT_SOURCE_DIR}/../..
+            ${GTEST_DIR}
+            ${STUBS_DIR}
         )
 
-        add_test(NAME test_${{component_name}} COMMAND test_${{component_name}})
+        add_test(NAME test_${component_name} COMMAND test_${component_name})
     else()
-        message(STATUS "Test file not found for ${{component_name}}: ${{TEST_FILE}}")
+        message(STATUS "Source file not found for ${test_src}: ${SOURCE_FILE}")
     endif()
-endfunction()
-
+endforeach()
 """
-    
-    # Add tests for each source file
-    for src_file in source_files:
-        component_name = os.path.splitext(src_file)[0]
-        cmake_content += f"add_component_test({component_name})\n"
-    
+
     cmake_path = os.path.join(BUILD_DIR, "CMakeLists.txt")
-    with open(cmake_path, 'w') as f:
-        f.write(cmake_content)
-    
-    cmd_cmake = ["cmake", "."]
+    # Rewriting an unchanged CMakeLists.txt would make the build re-run configure
     try:
-        subprocess.run(cmd_cmake, cwd=BUILD_DIR, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"CMake configuration failed: {e}")
-        sys.exit(1)
+        with open(cmake_path) as f:
+            unchanged = f.read() == cmake_content
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        with open(cmake_path, 'w') as f:
+            f.write(cmake_content)
+    
+    if needs_configure(BUILD_DIR, BUILD_DIR):
+        cmd_cmake = ["cmake", *cmake_generator_args(BUILD_DIR), "."]
+        try:
+            subprocess.run(cmd_cmake, cwd=BUILD_DIR, check=True)
+        except subprocess.CalledProcessError as e:
+            print(f"CMake configuration failed: {e}")
+            sys.exit(1)
+    else:
+        print("CMake cache up to date, skipping configure")
 
     # 3. Build
     print("\n=== Step 3: Building Tests ===")
-    cmd_build = ["cmake", "--build", "."]
+    cmd_build = ["cmake", "--build", ".", "--parallel", str(args.build_jobs)]
     try:
         subprocess.run(cmd_build, cwd=BUILD_DIR, check=True)
     except subprocess.CalledProcessError as e:
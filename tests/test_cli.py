@@ -1,51 +1,341 @@
 """Tests for AI Test Runner CLI."""
 
+import io
 import os
 import pytest
+import shutil
 import subprocess
+import threading
+import zipfile
+from pathlib import Path
 from unittest.mock import patch, MagicMock
-from ai_test_runner.cli import main, AITestRunner
+from ai_test_runner.cli import (
+    main, AITestRunner, _discard_tree, _enforce_manual_review_gate, _parse_ctest_junit,
+    _unity_cache_dir, needs_configure, parallel_copytree,
+)
+
+
+def _fake_run(returncode, stdout=b'', stderr=b''):
+    """Build a subprocess.run side effect that writes stdout to the redirected file."""
+    def run(cmd, **kwargs):
+        kwargs['stdout'].write(stdout)
+        return subprocess.CompletedProcess(cmd, returncode, stderr=stderr)
+    return run
+
+
+def _fake_pipeline(calls, ctest_version='3.25.1', ctest_returncode=0, ctest_log=b'', junit=None):
+    """Build a subprocess.run side effect standing in for cmake and ctest in AITestRunner.run()."""
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd[:2] == ['ctest', '--version']:
+            return subprocess.CompletedProcess(cmd, 0, stdout=f'ctest version {ctest_version}\n')
+        if cmd[0] == 'ctest':
+            kwargs['stdout'].write(ctest_log)
+            if junit is not None and '--output-junit' in cmd:
+                Path(cmd[cmd.index('--output-junit') + 1]).write_text(junit)
+            return subprocess.CompletedProcess(cmd, ctest_returncode)
+        return subprocess.CompletedProcess(cmd, 0)
+    return run
+
+
+def _pipeline_runner(tmp_path):
+    """An AITestRunner whose steps before configure are stubbed out."""
+    runner = AITestRunner(repo_path=str(tmp_path), jobs=2, build_jobs=3)
+    runner.find_compilable_tests = MagicMock(return_value=[runner.tests_dir / 'test_foo.c'])
+    runner.copy_unity_framework = MagicMock(return_value=True)
+    runner.copy_source_files = MagicMock()
+    runner.copy_test_files = MagicMock()
+    runner._write_gtest_case_reports = MagicMock()
+    return runner
+
+
+_JUNIT_REPORT = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<testsuite tests="2">\n'
+    '  <testcase name="test_foo" status="run"/>\n'
+    '  <testcase name="test_bar" status="{status}">{failure}</testcase>\n'
+    '</testsuite>\n'
+)
 
 
 class TestAITestRunner:
     """Test the AITestRunner class."""
 
-    @patch('ai_test_runner.cli.subprocess.run')
-    @patch('ai_test_runner.cli.shutil.copytree')
-    @patch('ai_test_runner.cli.shutil.copy2')
-    @patch('ai_test_runner.cli.Path')
-    def test_find_compilable_tests(self, mock_path, mock_copy2, mock_copytree, mock_subprocess):
+    def test_find_compilable_tests(self, tmp_path):
         """Test finding compilable tests."""
-        # Mock Path to avoid directory creation issues
-        mock_path_instance = MagicMock()
-        mock_path.return_value = mock_path_instance
+        runner = AITestRunner(repo_path=str(tmp_path))
 
-        runner = AITestRunner(repo_path='/fake/path')
-
-        # Mock the verification directory methods
-        runner.verification_dir = MagicMock()
-        runner.verification_dir.exists.return_value = True
-        runner.verification_dir.glob.return_value = [
-            MagicMock(stem='test1_compiles_yes'),
-            MagicMock(stem='test2_compiles_yes'),
-        ]
-
-        # Mock the tests directory and test files
-        runner.tests_dir = MagicMock()
-        def mock_truediv(filename):
-            mock_file = MagicMock()
-            mock_file.exists.return_value = True
-            mock_file.stem = filename.replace('.c', '')
-            mock_file.name = filename
-            return mock_file
-        runner.tests_dir.__truediv__.side_effect = mock_truediv
+        runner.verification_dir.mkdir(parents=True)
+        for name in ['test1', 'test2', 'test3']:
+            (runner.verification_dir / f"{name}_compiles_yes.txt").write_text('')
+        (runner.tests_dir / 'test1.c').write_text('')
+        (runner.tests_dir / 'test2.cpp').write_text('')
 
         tests = runner.find_compilable_tests()
 
         assert len(tests) == 2
         # Tests should now be Path objects, not strings
-        assert tests[0].stem in ['test1', 'test2']
-        assert tests[1].stem in ['test1', 'test2']
+        assert sorted(t.stem for t in tests) == ['test1', 'test2']
+
+    def test_find_compilable_tests_prefers_c_extension(self, tmp_path):
+        """Test that .c wins over C++ extensions for the same test name."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+
+        runner.verification_dir.mkdir(parents=True)
+        (runner.verification_dir / 'test_dup_compiles_yes.txt').write_text('')
+        (runner.tests_dir / 'test_dup.cpp').write_text('')
+        (runner.tests_dir / 'test_dup.c').write_text('')
+
+        tests = runner.find_compilable_tests()
+
+        assert [t.name for t in tests] == ['test_dup.c']
+
+    def test_detect_language(self, tmp_path):
+        """Test language detection from test file extensions."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+
+        assert runner.detect_language([Path('test_a.c'), Path('test_b.c++')]) == 'cpp'
+        assert runner.detect_language([Path('test_a.c')]) == 'c'
+        assert runner.detect_language([Path('notes.txt')]) == 'cpp'
+
+        runner.language = 'c'
+        assert runner.detect_language([Path('test_b.cpp')]) == 'c'
+
+    def test_copy_source_files(self, tmp_path):
+        """Test that main() is renamed, headers are generated and other sources are copied verbatim."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+        runner.source_dir.mkdir()
+        (runner.source_dir / 'app.c').write_text(
+            'int add(int a, int b) {\n    return a + b;\n}\n'
+            'int main(void) {\n    return add(1, 2);\n}\n'
+        )
+        # Not valid UTF-8, which must not matter for files that need no rewriting
+        latin1 = b'/* caf\xe9 */\nvoid blink(void) {\n}\n'
+        (runner.source_dir / 'led.c').write_bytes(latin1)
+
+        runner.copy_source_files()
+
+        src_build_dir = runner.output_dir / 'src'
+        assert 'int app_main(void)' in (src_build_dir / 'app.c').read_text()
+        header = (src_build_dir / 'app.h').read_text()
+        assert 'int add(int a, int b);' in header
+        assert 'main' not in header
+        assert (src_build_dir / 'led.c').read_bytes() == latin1
+
+    def test_copy_test_files(self, tmp_path):
+        """Test that C tests are rewritten and other tests are copied verbatim."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+        c_test = runner.tests_dir / 'test_foo.c'
+        c_test.write_text(
+            '#include "unity.h"\n'
+            'void test_main(void) { main(); }\n'
+            'int main(void) { return 0; }\n'
+        )
+        cpp_test = runner.tests_dir / 'test_bar.cpp'
+        cpp_test.write_text('int main() { return 0; }\n')
+
+        runner.copy_test_files([c_test, cpp_test])
+
+        c_out = (runner.output_dir / 'tests' / 'test_foo.c').read_text()
+        assert c_out.startswith('#include "unity.h"\n#include "../src/foo.c"\n')
+        assert 'app_main();' in c_out
+        assert 'int main(void)' in c_out
+        assert (runner.output_dir / 'tests' / 'test_bar.cpp').read_text() == cpp_test.read_text()
+
+    def test_copy_test_files_keeps_existing_source_includes(self, tmp_path):
+        """Test that C tests including their source or a ../src/ header are not given another include."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+        runner.source_dir.mkdir()
+        (runner.source_dir / 'calc.c').write_text('int add(int a, int b) { return a + b; }\n')
+        runner.copy_source_files()
+        tests = {
+            'test_calc.c': '#include "unity.h"\n#include "calc.c"\n',
+            'test_calc_api.c': '#include "unity.h"\n#include "../src/calc.h"\n',
+        }
+        for name, content in tests.items():
+            (runner.tests_dir / name).write_text(content)
+
+        runner.copy_test_files([runner.tests_dir / name for name in tests])
+
+        for name, content in tests.items():
+            assert (runner.output_dir / 'tests' / name).read_text() == content
+
+    def test_create_c_cmake_lists_links_source_objects(self, tmp_path):
+        """Test that C sources under test are built once as object libraries and linked."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+        runner.source_dir.mkdir()
+        (runner.source_dir / 'foo.c').write_text('')
+        (runner.source_dir / 'bar.c').write_text('')
+        (runner.source_dir / 'baz.c').write_text('')
+        (runner.source_dir / 'qux.c').write_text('')
+        (runner.tests_dir / 'test_bar.c').write_text('#include "unity.h"\n#include "../src/bar.c"\n')
+        (runner.tests_dir / 'test_baz.c').write_text('#include <unity.h>\n#include "baz.c"\n')
+        # Gets ../src/qux.c injected by copy_test_files, whether or not that has run yet
+        (runner.tests_dir / 'test_qux.c').write_text('#include "unity.h"\n')
+
+        runner.create_c_cmake_lists([
+            runner.tests_dir / name
+            for name in ['test_foo.c', 'test_bar.c', 'test_baz.c', 'test_qux.c', 'test_orphan.c']
+        ])
+
+        cmake = (runner.output_dir / 'CMakeLists.txt').read_text()
+        assert 'add_library(foo_uut OBJECT src/foo.c)\n' in cmake
+        assert 'add_executable(test_foo tests/test_foo.c $<TARGET_OBJECTS:foo_uut>)\n' in cmake
+        for name in ['bar', 'baz', 'qux']:
+            assert f'{name}_uut' not in cmake
+            assert f'add_executable(test_{name} tests/test_{name}.c)\n' in cmake
+        assert 'add_executable(test_orphan tests/test_orphan.c)\n' in cmake
+
+    def test_create_cmake_lists_finds_sources_in_src_and_root(self, tmp_path):
+        """Test that repo-root CMakeLists.txt links src/ sources first, then root sources."""
+        (tmp_path / 'src').mkdir()
+        (tmp_path / 'src' / 'foo.cpp').write_text('')
+        (tmp_path / 'foo.cpp').write_text('')
+        (tmp_path / 'bar.cpp').write_text('')
+        runner = AITestRunner(repo_path=str(tmp_path))
+        tests = [Path('tests') / f'test_{n}.cpp' for n in ('foo', 'bar', 'baz')]
+
+        runner.create_cmake_lists(tests, 'cpp')
+
+        cmake = (tmp_path / 'CMakeLists.txt').read_text()
+        assert 'add_library(foo_lib OBJECT src/foo.cpp)' in cmake
+        assert 'add_library(bar_lib OBJECT bar.cpp)' in cmake
+        assert 'baz_lib' not in cmake
+        assert runner._expected_executables == ['test_foo', 'test_bar', 'test_baz']
+
+    @patch('urllib.request.urlopen')
+    def test_copy_unity_framework_download(self, mock_urlopen, tmp_path, monkeypatch):
+        """Test that Unity is downloaded into the user cache once and shared by later builds."""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('Unity-2.5.2/README.md', 'readme')
+            zf.writestr('Unity-2.5.2/src/unity.c', '/* unity */')
+            zf.writestr('Unity-2.5.2/src/unity.h', '/* header */')
+        mock_urlopen.return_value.__enter__.return_value.read.return_value = archive.getvalue()
+
+        for name in ['repo', 'other_repo']:
+            repo = tmp_path / name
+            repo.mkdir()
+            runner = AITestRunner(repo_path=str(repo))
+
+            assert runner.copy_unity_framework() is True
+            unity_src = runner.output_dir / 'unity' / 'src'
+            assert sorted(p.name for p in unity_src.iterdir()) == ['unity.c', 'unity.h']
+
+        assert mock_urlopen.call_count == 1
+        cache = tmp_path / 'cache' / 'ai_test_runner'
+        assert [p.name for p in cache.iterdir()] == ['unity-v2.5.2']
+
+    def test_unity_cache_dir_ignores_relative_xdg_cache_home(self, tmp_path, monkeypatch):
+        """Test that a relative XDG_CACHE_HOME falls back to ~/.cache."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        monkeypatch.setenv('XDG_CACHE_HOME', 'relative/cache')
+
+        cache_dir = _unity_cache_dir()
+
+        assert cache_dir.is_absolute()
+        assert cache_dir.parent == tmp_path / '.cache' / 'ai_test_runner'
+
+    def test_copy_unity_framework_reference_is_linked_once(self, tmp_path):
+        """Test that the reference Unity is hardlinked and not re-copied when unchanged."""
+        reference = tmp_path / 'ai-test-gemini-CLI' / 'unity' / 'src'
+        reference.mkdir(parents=True)
+        (reference / 'unity.c').write_text('/* unity */')
+        repo = tmp_path / 'repo'
+        repo.mkdir()
+        runner = AITestRunner(repo_path=str(repo))
+
+        assert runner.copy_unity_framework() is True
+        copied = runner.output_dir / 'unity' / 'src' / 'unity.c'
+        assert copied.stat().st_ino == (reference / 'unity.c').stat().st_ino
+
+        with patch('ai_test_runner.cli.parallel_copytree') as mock_copytree:
+            assert runner.copy_unity_framework() is True
+            mock_copytree.assert_not_called()
+
+    def test_parallel_copytree(self, tmp_path):
+        """Test that the parallel copy reproduces nested trees, including empty directories."""
+        src = tmp_path / 'src'
+        (src / 'a' / 'b').mkdir(parents=True)
+        (src / 'empty').mkdir()
+        (src / 'top.h').write_text('top')
+        (src / 'a' / 'b' / 'deep.cpp').write_text('deep')
+
+        parallel_copytree(src, tmp_path / 'dst', workers=2)
+
+        dst = tmp_path / 'dst'
+        assert (dst / 'top.h').read_text() == 'top'
+        assert (dst / 'a' / 'b' / 'deep.cpp').read_text() == 'deep'
+        assert (dst / 'empty').is_dir()
+
+    def test_discard_tree(self, tmp_path):
+        """Test that a discarded tree frees its path at once and is deleted in the background."""
+        tree = tmp_path / 'unity'
+        (tree / 'src').mkdir(parents=True)
+        (tree / 'src' / 'unity.c').write_text('')
+
+        _discard_tree(tree)
+
+        assert not tree.exists()
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread() and not thread.daemon:
+                thread.join()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_setup_cpp_framework_keeps_unchanged_files(self, tmp_path):
+        """Test that regenerating identical framework files leaves their mtimes alone."""
+        repo = tmp_path / 'repo'
+        repo.mkdir()
+        runner = AITestRunner(repo_path=str(repo))
+        assert runner.setup_cpp_framework() is True
+
+        generated = [
+            runner.output_dir / 'gtest' / 'gtest.h',
+            runner.output_dir / 'arduino_stubs' / 'Arduino_stubs.h',
+            runner.output_dir / 'arduino_stubs' / 'Arduino_stubs.cpp',
+        ]
+        for path in generated:
+            os.utime(path, (1_000_000, 1_000_000))
+
+        assert runner.setup_cpp_framework() is True
+        assert [path.stat().st_mtime for path in generated] == [1_000_000] * 3
+
+    def test_needs_configure(self, tmp_path):
+        """Test that configure is skipped only for a cache recorded against the same source dir."""
+        build = tmp_path / 'build'
+        build.mkdir()
+        assert needs_configure(build, tmp_path)
+
+        (build / 'CMakeCache.txt').write_text(
+            f"CMAKE_HOME_DIRECTORY:INTERNAL={tmp_path}\nRAILWAY_FETCH_GTEST:UNINITIALIZED=ON\n"
+        )
+        # A cache without the generator's build file is left by a failed configure
+        assert needs_configure(build, tmp_path)
+
+        (build / 'Makefile').write_text('')
+        assert not needs_configure(build, tmp_path)
+        assert not needs_configure(build, tmp_path, {'RAILWAY_FETCH_GTEST': 'ON'})
+        assert needs_configure(build, tmp_path, {'RAILWAY_FETCH_GTEST': 'OFF'})
+        assert needs_configure(build, tmp_path, {'OTHER_OPTION': 'ON'})
+        assert needs_configure(build, tmp_path / 'other')
+
+    @pytest.mark.skipif(shutil.which('cmake') is None, reason='requires cmake')
+    def test_needs_configure_after_failed_configure(self, tmp_path):
+        """Test that a real failed configure is not mistaken for a usable build tree."""
+        src = tmp_path / 'src'
+        src.mkdir()
+        (src / 'CMakeLists.txt').write_text(
+            'cmake_minimum_required(VERSION 3.14)\nproject(x NONE)\nmessage(FATAL_ERROR "fetch failed")\n'
+        )
+        build = tmp_path / 'build'
+
+        result = subprocess.run(['cmake', '-S', str(src), '-B', str(build), '-DRAILWAY_FETCH_GTEST=ON'],
+                                capture_output=True)
+
+        assert result.returncode != 0
+        assert (build / 'CMakeCache.txt').exists()
+        assert needs_configure(build, src, {'RAILWAY_FETCH_GTEST': 'ON'})
 
     @patch('ai_test_runner.cli.subprocess.run')
     def test_build_tests_success(self, mock_subprocess):
@@ -58,6 +348,21 @@ class TestAITestRunner:
         assert result is True
         mock_subprocess.assert_called()
 
+    @patch('ai_test_runner.cli.shutil.which')
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_build_tests_prefers_ninja(self, mock_subprocess, mock_which, tmp_path):
+        """Test that Ninja is selected for a fresh build tree and the build runs in parallel."""
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout='', stderr='')
+        mock_which.return_value = '/usr/bin/ninja'
+
+        runner = AITestRunner(repo_path=str(tmp_path))
+        assert runner.build_tests() is True
+
+        configure_cmd = mock_subprocess.call_args_list[0][0][0]
+        build_cmd = mock_subprocess.call_args_list[1][0][0]
+        assert configure_cmd[:3] == ['cmake', '-G', 'Ninja']
+        assert '--parallel' in build_cmd
+
     @patch('ai_test_runner.cli.subprocess.run')
     def test_build_tests_failure(self, mock_subprocess):
         """Test build failure."""
@@ -68,21 +373,15 @@ class TestAITestRunner:
 
         assert result is False
 
-    @patch('ai_test_runner.cli.os.access')
+    @patch('ai_test_runner.cli._is_executable_file')
     @patch('ai_test_runner.cli.subprocess.run')
-    def test_run_tests_success(self, mock_subprocess, mock_access):
+    def test_run_tests_success(self, mock_subprocess, mock_is_executable, tmp_path):
         """Test successful test execution."""
-        mock_subprocess.return_value = MagicMock(returncode=0, stdout='All tests passed', stderr='')
-        mock_access.return_value = True
+        mock_subprocess.side_effect = _fake_run(0, b'All tests passed\n')
+        mock_is_executable.return_value = True
 
-        runner = AITestRunner(repo_path='/fake/path')
-        # Mock some test executables
-        runner.output_dir = MagicMock()
-        mock_exe = MagicMock()
-        mock_exe.is_file.return_value = True
-        mock_exe.name = 'test_main.exe'
-        mock_exe.suffix = '.exe'
-        runner.output_dir.glob.return_value = [mock_exe]
+        runner = AITestRunner(repo_path=str(tmp_path))
+        runner._expected_executables = ['test_main']
 
         results = runner.run_tests()
 
@@ -90,22 +389,17 @@ class TestAITestRunner:
         # Should have one result for the successful test
         assert len(results) == 1
         assert results[0]['success']
+        assert results[0]['output'] == 'All tests passed\n'
 
-    @patch('ai_test_runner.cli.os.access')
+    @patch('ai_test_runner.cli._is_executable_file')
     @patch('ai_test_runner.cli.subprocess.run')
-    def test_run_tests_failure(self, mock_subprocess, mock_access):
+    def test_run_tests_failure(self, mock_subprocess, mock_is_executable, tmp_path):
         """Test test execution with failures."""
-        mock_subprocess.return_value = MagicMock(returncode=1, stdout='', stderr='Test failed')
-        mock_access.return_value = True
+        mock_subprocess.side_effect = _fake_run(1, stderr=b'Test failed')
+        mock_is_executable.return_value = True
 
-        runner = AITestRunner(repo_path='/fake/path')
-        # Mock some test executables
-        runner.output_dir = MagicMock()
-        mock_exe = MagicMock()
-        mock_exe.is_file.return_value = True
-        mock_exe.name = 'test_main.exe'
-        mock_exe.suffix = '.exe'
-        runner.output_dir.glob.return_value = [mock_exe]
+        runner = AITestRunner(repo_path=str(tmp_path))
+        runner._expected_executables = ['test_main']
 
         results = runner.run_tests()
 
@@ -113,6 +407,244 @@ class TestAITestRunner:
         # Should have one result for the failed test
         assert len(results) == 1
         assert not results[0]['success']
+        assert results[0]['errors'] == 'Test failed'
+
+    @patch('ai_test_runner.cli._is_executable_file')
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_run_tests_multiple_executables_sorted(self, mock_subprocess, mock_is_executable, tmp_path):
+        """Test that concurrently executed tests are reported in name order."""
+        mock_subprocess.side_effect = _fake_run(0)
+        mock_is_executable.return_value = True
+
+        runner = AITestRunner(repo_path=str(tmp_path))
+        runner._expected_executables = ['test_zeta', 'test_alpha', 'test_mid']
+
+        results = runner.run_tests()
+
+        assert [Path(r['name']).stem for r in results] == ['test_alpha', 'test_mid', 'test_zeta']
+        assert mock_subprocess.call_count == 3
+
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_run_tests_uses_generated_targets(self, mock_subprocess, tmp_path):
+        """Test that only executables declared in the generated CMakeLists.txt are run."""
+        mock_subprocess.side_effect = _fake_run(0)
+
+        runner = AITestRunner(repo_path=str(tmp_path))
+        runner.create_c_cmake_lists([runner.tests_dir / 'test_foo.c'])
+        suffix = '.exe' if os.name == 'nt' else ''
+        for name in ['test_foo', 'test_stale']:
+            exe = runner.output_dir / f"{name}{suffix}"
+            exe.write_text('')
+            exe.chmod(0o755)
+
+        results = runner.run_tests()
+
+        assert [r['name'] for r in results] == [f"test_foo{suffix}"]
+
+    @pytest.mark.skipif(os.name == 'nt', reason='uses a POSIX shell script as the test executable')
+    def test_run_tests_parses_unity_output(self, tmp_path):
+        """Test that Unity results are counted from a real executable's output."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+        exe = runner.output_dir / 'test_math'
+        exe.write_text(
+            '#!/bin/sh\n'
+            'echo "test_math.c:10:test_add:PASS"\n'
+            'echo "test_math.c:20:test_sub:FAIL: Expected 1 Was 2"\n'
+            'echo "test_math.c:30:test_mul:PASS"\n'
+            'echo "-----------------------"\n'
+            'echo "3 Tests 1 Failures 0 Ignored "\n'
+            'echo "oops" >&2\n'
+            'exit 1\n'
+        )
+        exe.chmod(0o755)
+
+        results = runner.run_tests()
+
+        assert len(results) == 1
+        result = results[0]
+        assert not result['success']
+        assert result['returncode'] == 1
+        assert (result['individual_tests'], result['individual_passed'], result['individual_failed']) == (3, 2, 1)
+        assert 'test_sub:FAIL' in result['output']
+        assert result['errors'] == 'oops\n'
+
+    @pytest.mark.skipif(os.name == 'nt', reason='uses a POSIX shell script as the test executable')
+    def test_run_tests_counts_gtest_output(self, tmp_path):
+        """Test that the bundled gtest's PASS/FAIL lines are counted when there is no Unity summary."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+        exe = runner.output_dir / 'test_led'
+        exe.write_text(
+            '#!/bin/sh\n'
+            'echo "[ RUN ] Led.On"\n'
+            'echo "[ PASS ] Led.On"\n'
+            'echo "[ RUN ] Led.Off"\n'
+            'echo "[ FAIL ] Led.Off: expected LOW"\n'
+            'echo "[ PASS ] Led.Blink"\n'
+            'exit 1\n'
+        )
+        exe.chmod(0o755)
+
+        result = runner.run_tests()[0]
+
+        assert (result['individual_tests'], result['individual_passed'], result['individual_failed']) == (3, 2, 1)
+
+    @pytest.mark.skipif(os.name == 'nt', reason='uses a POSIX shell script as the test executable')
+    @patch('ai_test_runner.cli._TEST_TIMEOUT', 0.5)
+    def test_run_tests_timeout(self, tmp_path):
+        """Test that a hanging executable is killed and reported as timed out."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+        exe = runner.output_dir / 'test_hang'
+        exe.write_text('#!/bin/sh\nexec sleep 30\n')
+        exe.chmod(0o755)
+
+        results = runner.run_tests()
+
+        assert len(results) == 1
+        assert not results[0]['success']
+        assert results[0]['errors'] == 'Test timed out'
+
+    def test_parse_ctest_junit(self, tmp_path):
+        """Test that CTest's JUnit report yields one result per test, with not-run tests failing."""
+        report = tmp_path / 'ctest.xml'
+        report.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<testsuite name="(empty)" tests="3" failures="1" skipped="1">\n'
+            '  <testcase name="test_ok" status="run"><system-out>hi\n</system-out></testcase>\n'
+            '  <testcase name="test_bad" status="fail"><failure message=""/></testcase>\n'
+            '  <testcase name="test_gone" status="notrun"><skipped message="Unable to find executable"/></testcase>\n'
+            '</testsuite>\n'
+        )
+
+        results = _parse_ctest_junit(report)
+
+        assert [(r['name'], r['passed']) for r in results] == [('test_ok', True), ('test_bad', False), ('test_gone', False)]
+        assert results[0]['output'] == 'hi\n'
+        assert _parse_ctest_junit(tmp_path / 'missing.xml') == []
+
+    def test_generate_test_reports(self, tmp_path):
+        """Test the per-executable report layout, including the optional errors section."""
+        runner = AITestRunner(repo_path=str(tmp_path))
+        runner.test_reports_dir.mkdir(parents=True, exist_ok=True)
+        result = {
+            'name': 'test_foo', 'returncode': 1, 'success': False,
+            'individual_tests': 2, 'individual_passed': 1, 'individual_failed': 1,
+            'errors': 'boom', 'output': '',
+        }
+
+        runner.generate_test_reports([result, dict(result, name='test_bar', errors='', output='ok\n')])
+
+        foo = (runner.test_reports_dir / 'test_foo_report.txt').read_text()
+        assert foo.startswith('=' * 60 + '\nTEST REPORT: test_foo\n')
+        assert 'Overall Status: FAILED\n' in foo
+        assert 'ERRORS\n----------\nboom\n\nDETAILED OUTPUT' in foo
+        assert foo.endswith('(No output captured)\n\n' + '=' * 60 + '\n')
+        bar = (runner.test_reports_dir / 'test_bar_report.txt').read_text()
+        assert 'ERRORS' not in bar
+        assert bar.endswith('-' * 20 + '\nok\n\n' + '=' * 60 + '\n')
+
+
+class TestRunPipeline:
+    """Test AITestRunner.run()'s CMake/CTest steps with subprocess mocked."""
+
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_run_passes_when_junit_report_passes(self, mock_run, tmp_path):
+        """Test that run() succeeds when every test in the JUnit report passed."""
+        calls = []
+        mock_run.side_effect = _fake_pipeline(
+            calls, ctest_log=b'100% tests passed\n', junit=_JUNIT_REPORT.format(status='run', failure='')
+        )
+        runner = _pipeline_runner(tmp_path)
+
+        assert runner.run() is True
+        ctest_cmd = calls[-1]
+        assert ctest_cmd[0] == 'ctest' and '--output-junit' in ctest_cmd
+        # The logged output is handed to the reports, not stored on the CompletedProcess
+        (ctest_result,), kwargs = runner._write_gtest_case_reports.call_args
+        assert kwargs == {'ctest_output': '100% tests passed\n'}
+        assert ctest_result.stdout is None
+
+    @patch('ai_test_runner.cli.shutil.which', return_value=None)
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_run_issues_configure_and_build_commands(self, mock_run, mock_which, tmp_path):
+        """Test the cmake configure and build commands run() issues, using build_jobs for --parallel."""
+        calls = []
+        mock_run.side_effect = _fake_pipeline(calls, junit=_JUNIT_REPORT.format(status='run', failure=''))
+        runner = _pipeline_runner(tmp_path)
+
+        assert runner.run() is True
+        assert calls[0] == [
+            'cmake', '-S', str(runner.repo_path), '-B', str(runner.output_dir), '-DRAILWAY_FETCH_GTEST=ON',
+        ]
+        assert calls[1] == ['cmake', '--build', '.', '--parallel', '3']
+        assert mock_run.call_args_list[1].kwargs['cwd'] == runner.output_dir
+
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_run_fails_on_failed_junit_case(self, mock_run, tmp_path):
+        """Test that one failed test in the JUnit report fails the run."""
+        calls = []
+        mock_run.side_effect = _fake_pipeline(
+            calls, ctest_returncode=8, junit=_JUNIT_REPORT.format(status='fail', failure='<failure message=""/>')
+        )
+
+        assert _pipeline_runner(tmp_path).run() is False
+
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_run_falls_back_without_junit_support(self, mock_run, tmp_path):
+        """Test that with CTest < 3.21 the exit status and log decide the result."""
+        calls = []
+        mock_run.side_effect = _fake_pipeline(calls, ctest_version='3.16.3', ctest_log=b'100% tests passed\n')
+
+        assert _pipeline_runner(tmp_path).run() is True
+        assert '--output-junit' not in calls[-1]
+
+        mock_run.side_effect = _fake_pipeline([], ctest_version='3.16.3', ctest_log=b'No tests were found!!!\n')
+        assert _pipeline_runner(tmp_path).run() is False
+
+        mock_run.side_effect = _fake_pipeline([], ctest_version='3.16.3', ctest_returncode=8)
+        assert _pipeline_runner(tmp_path).run() is False
+
+
+class TestManualReviewGate:
+    """Test the manual review gate."""
+
+    APPROVAL = "approved = true\nreviewed_by = <human_name>\ndate = <ISO date>\n"
+
+    def _write_review(self, repo, generated, flags):
+        review_dir = repo / 'tests' / 'review'
+        review_dir.mkdir(parents=True)
+        (review_dir / 'review_required.md').write_text(
+            '# Review required\n\n'
+            '## Generated test files\n'
+            + ''.join(f'- {item}\n' for item in generated)
+            + '\n## Notes\n- tests/not_a_generated_test.c\n'
+        )
+        for name, content in flags.items():
+            (review_dir / f'APPROVED.{name}.flag').write_bytes(content.encode())
+
+    def test_gate_passes_with_approvals(self, tmp_path):
+        """Test that every listed test with a matching flag lets the build proceed."""
+        self._write_review(tmp_path, ['tests/test_a.c', 'tests\\test_b.cpp', '(none)'], {
+            'test_a.c': self.APPROVAL,
+            'test_b.cpp': self.APPROVAL.replace('\n', '\r\n'),
+        })
+
+        _enforce_manual_review_gate(tmp_path)
+
+    def test_gate_blocks_missing_approval(self, tmp_path):
+        """Test that a listed test without a flag halts the build."""
+        self._write_review(tmp_path, ['tests/test_a.c', 'tests/test_b.c'], {'test_a.c': self.APPROVAL})
+
+        with pytest.raises(SystemExit) as exc:
+            _enforce_manual_review_gate(tmp_path)
+        assert exc.value.code == 3
+
+    def test_gate_blocks_wrong_approval_content(self, tmp_path):
+        """Test that a flag with unexpected content halts the build."""
+        self._write_review(tmp_path, ['tests/test_a.c'], {'test_a.c': 'approved = yes\n'})
+
+        with pytest.raises(SystemExit) as exc:
+            _enforce_manual_review_gate(tmp_path)
+        assert exc.value.code == 3
 
 
 class TestCLI:
@@ -140,6 +672,53 @@ class TestCLI:
             with pytest.raises(SystemExit):
                 main()
 
+    @patch('ai_test_runner.cli._enforce_manual_review_gate')
+    @patch('ai_test_runner.cli.AITestRunner')
+    def test_main_passes_job_counts(self, mock_runner_class, mock_gate):
+        """Test that --jobs and --build-jobs are forwarded to the runner."""
+        mock_runner_class.return_value.run.return_value = True
+
+        with patch('sys.argv', ['ai-test-runner', 'repo', '--jobs', '3', '--build-jobs', '5']):
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_runner_class.assert_called_once_with('repo', 'build', 'auto', 3, 5)
+
+    @patch('ai_test_runner.cli.os.cpu_count', return_value=None)
+    @patch('ai_test_runner.cli._enforce_manual_review_gate')
+    @patch('ai_test_runner.cli.AITestRunner')
+    def test_main_job_counts_default_to_one_without_cpu_count(self, mock_runner_class, mock_gate, mock_cpu_count):
+        """Test that the job count defaults fall back to 1 when the CPU count is unknown."""
+        mock_runner_class.return_value.run.return_value = True
+
+        with patch('sys.argv', ['ai-test-runner', 'repo']):
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_runner_class.assert_called_once_with('repo', 'build', 'auto', 1, 1)
+
+    @pytest.mark.parametrize('jobs', ['0', '-1'])
+    @patch('ai_test_runner.cli.AITestRunner')
+    def test_main_rejects_non_positive_jobs(self, mock_runner_class, jobs):
+        """Test that --jobs below 1 is rejected by argparse."""
+        with patch('sys.argv', ['ai-test-runner', 'repo', '--jobs', jobs]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 2
+        mock_runner_class.assert_not_called()
+
+    @pytest.mark.parametrize('build_jobs', ['0', '-1'])
+    @patch('ai_test_runner.cli.AITestRunner')
+    def test_main_rejects_non_positive_build_jobs(self, mock_runner_class, build_jobs):
+        """Test that --build-jobs below 1 is rejected by argparse."""
+        with patch('sys.argv', ['ai-test-runner', 'repo', '--build-jobs', build_jobs]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 2
+        mock_runner_class.assert_not_called()
+
     def test_version(self):
         """Test version display."""
         with patch('sys.argv', ['ai-test-runner', '--version']):